@@ -1,7 +1,18 @@
 import streamlit as st
-import time # Used to simulate AI processing time
+import time # Used to poll background transcription between reruns
 import speech_recognition as sr # The tool we installed for audio
-import io  # For handling in-memory audio bytes
+from concurrent.futures import ThreadPoolExecutor # Runs STT off the script thread
+import html  # Escape transcript text before embedding it in markup
+import wave  # Decode recorded answers once into PCM
+import numpy as np
+from streamlit.runtime.scriptrunner import get_script_run_ctx # Tells fragment reruns from full-app runs
+
+# Local Whisper (CTranslate2) is preferred; fall back to Google if it isn't installed
+try:
+    from faster_whisper import WhisperModel
+    WHISPER_AVAILABLE = True
+except ImportError:
+    WHISPER_AVAILABLE = False
 
 # --- 1. CONFIGURATION AND STATE MANAGEMENT ---
 
@@ -15,17 +26,80 @@ if 'current_question' not in st.session_state:
     st.session_state.current_question = "Welcome! Configure your interview in the sidebar to begin."
 if 'transcript' not in st.session_state:
     st.session_state.transcript = []
+if '_rendered_len' not in st.session_state:
+    st.session_state._rendered_len = 0 # Transcript entries already baked into _transcript_html
+    st.session_state._transcript_html = ""
 
 # Dummy question generator (will be replaced by AI later)
 QUESTION_BANK = {
-    "HR": ["Tell me about a time you handled conflict.", "Where do you see yourself in 5 years?"],
-    "Technical": ["Explain the difference between a list and a tuple in Python.", "What is a primary key in SQL?"],
-    "Mixed": ["What's your biggest weakness?", "Walk me through a recent data project."],
+    "HR": ("Tell me about a time you handled conflict.", "Where do you see yourself in 5 years?"),
+    "Technical": ("Explain the difference between a list and a tuple in Python.", "What is a primary key in SQL?"),
+    "Mixed": ("What's your biggest weakness?", "Walk me through a recent data project."),
 }
+QUESTION_LEN = {mode: len(q_list) for mode, q_list in QUESTION_BANK.items()}
+
+# Transcript bubble style per speaker: (alignment, background, icon)
+_ROLE_STYLE = {
+    "AI": ("left", "#F3F4F6", "🤖"),
+    "User": ("right", "#E0E7FF", "👤"),
+}
+
+@st.cache_data(show_spinner=False)
 def get_next_question(mode, index):
     """Retrieves the next question based on the selected mode."""
-    q_list = QUESTION_BANK.get(mode, QUESTION_BANK["HR"])
-    return q_list[index % len(q_list)] # Cycle through questions
+    if mode not in QUESTION_BANK:
+        mode = "HR"
+    return QUESTION_BANK[mode][index % QUESTION_LEN[mode]] # Cycle through questions
+
+@st.cache_resource(show_spinner=False)
+def get_whisper():
+    """Loads the int8-quantized Whisper model once per server process."""
+    return WhisperModel("base.en", device="cpu", compute_type="int8")
+
+WHISPER_SAMPLE_RATE = 16000
+
+@st.cache_resource(show_spinner=False)
+def get_stt_pool():
+    """Shared worker pool so transcription never blocks the Streamlit script thread."""
+    return ThreadPoolExecutor(max_workers=2)
+
+def decode_wav(audio_value):
+    """Decodes a WAV recording once into mono PCM samples for transcription."""
+    # Streamlit's audio_input returns an UploadedFile, which is already a
+    # seekable in-memory stream; read it in place instead of copying the bytes.
+    audio_value.seek(0)
+    with wave.open(audio_value, "rb") as wav:
+        channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+    pcm = np.frombuffer(frames, dtype=f"<i{width}")
+    if channels > 1:
+        pcm = pcm.reshape(-1, channels).mean(axis=1).astype(pcm.dtype)
+    return pcm, rate
+
+def transcribe_answer(audio_value, pcm, rate):
+    """Converts a recorded answer to text. Runs on the STT pool, so it must not touch st.session_state."""
+    if WHISPER_AVAILABLE:
+        # Whisper takes 16 kHz float32 samples directly; other rates go through its own resampling decoder
+        if rate == WHISPER_SAMPLE_RATE:
+            audio = pcm.astype(np.float32) / np.iinfo(pcm.dtype).max
+        else:
+            audio_value.seek(0)
+            audio = audio_value
+        segments, _ = get_whisper().transcribe(audio, vad_filter=True)
+        user_text = " ".join(s.text.strip() for s in segments).strip()
+        if not user_text:
+            raise sr.UnknownValueError()
+        return user_text
+
+    # Hand the already-decoded samples to SpeechRecognition instead of re-parsing the WAV
+    recognizer = sr.Recognizer()
+    return recognizer.recognize_google(sr.AudioData(pcm.tobytes(), rate, pcm.dtype.itemsize))
+
+def rerun_panel():
+    """Reruns only the calling fragment when it is running on its own; during a
+    full-app run (e.g. a sidebar change) a fragment-scoped rerun is an error, so rerun the app."""
+    ctx = get_script_run_ctx()
+    st.rerun(scope="fragment" if ctx is not None and ctx.fragment_ids_this_run else "app")
 
 # --- 2. SIDEBAR (SETTINGS) ---
 
@@ -53,6 +127,11 @@ with st.sidebar:
         st.session_state.interview_started = True
         st.session_state.question_index = 0
         st.session_state.transcript = [] # Clear previous session
+        st.session_state._rendered_len = 0 # Drop the cached transcript HTML too
+        st.session_state._transcript_html = ""
+        pending_stt = st.session_state.pop('stt_future', None) # A transcription still in flight belongs to the old interview
+        if pending_stt is not None:
+            pending_stt.cancel()
         st.session_state.current_question = get_next_question(interview_mode, 0)
         st.session_state.transcript.append({"speaker": "AI", "text": st.session_state.current_question})
         st.success("Interview started! Look at the main screen for your first question.")
@@ -78,21 +157,35 @@ with col1:
 
 
 # COLUMN 2: Interview Flow (Transcript & Input) 
-with col2:
+# Runs as a fragment so answering a question only reruns this panel,
+# not the camera widget and sidebar.
+@st.fragment
+def qa_panel():
     st.subheader("Interview Transcript & Input")
     
     # 3.2 Dynamic Transcript Display (The Conversation)
     transcript_placeholder = st.empty()
     
     # Display the current conversation log
-    # Note: Some Streamlit versions don't support container(height/border)
-    # Use a simple container for broad compatibility
-    with transcript_placeholder.container():
-        for entry in st.session_state.transcript:
-            if entry["speaker"] == "AI":
-                st.chat_message("assistant").write(entry["text"])
-            else:
-                st.chat_message("user").write(entry["text"])
+    # Only entries added since the last rerun are converted to HTML; the whole
+    # log is then pushed to the browser as a single markdown element.
+    transcript = st.session_state.transcript
+    if len(transcript) < st.session_state._rendered_len: # Transcript was reset
+        st.session_state._rendered_len = 0
+        st.session_state._transcript_html = ""
+    if len(transcript) > st.session_state._rendered_len:
+        new_html = []
+        for entry in transcript[st.session_state._rendered_len:]:
+            align, color, icon = _ROLE_STYLE.get(entry["speaker"], _ROLE_STYLE["User"])
+            new_html.append(
+                f"<div style='display:flex;justify-content:{align};margin-bottom:0.5rem;'>"
+                f"<div style='background:{color};padding:0.5rem 1rem;border-radius:12px;max-width:80%;'>"
+                f"{icon} {html.escape(entry['text'])}"
+                f"</div></div>"
+            )
+        st.session_state._transcript_html += "".join(new_html)
+        st.session_state._rendered_len = len(transcript)
+    transcript_placeholder.markdown(st.session_state._transcript_html, unsafe_allow_html=True)
 
     st.markdown("---")
 
@@ -103,41 +196,48 @@ with col2:
         # Audio input widget 
         audio_value = st.audio_input("🎤 Record Your Answer", key="user_mic_input")
 
-        # Logic to process the user's recorded answer
-        if audio_value is not None:
-            with st.spinner("Transcribing and evaluating your answer..."):
-                time.sleep(2) # Simulate processing time
-
-                # --- SPEECH-TO-TEXT IMPLEMENTATION ---
-                recognizer = sr.Recognizer()
-                try:
-                    # Streamlit's audio_input returns an UploadedFile-like object.
-                    # Convert to BytesIO so SpeechRecognition can read it reliably.
-                    audio_bytes = audio_value.getvalue() if hasattr(audio_value, 'getvalue') else audio_value.read()
-                    with sr.AudioFile(io.BytesIO(audio_bytes)) as source:
-                        recognizer.adjust_for_ambient_noise(source, duration=0.3)
-                        audio_data = recognizer.record(source)
-                        user_text = recognizer.recognize_google(audio_data)
-
-                        # Update transcript with user's answer
-                        st.session_state.transcript.append({"speaker": "User", "text": user_text})
-
-                        # --- NEXT QUESTION LOGIC ---
-                        st.session_state.question_index += 1
-                        next_q = get_next_question(st.session_state.get('selected_mode', 'HR'), st.session_state.question_index)
-                        
-                        st.session_state.current_question = next_q
-                        st.session_state.transcript.append({"speaker": "AI", "text": next_q})
-
-                        # Rerun the script to update the transcript with the new Q&A
-                        st.rerun() 
-
-                except sr.UnknownValueError:
-                    st.warning("⚠️ Could not understand audio. Please try recording again.")
-                except sr.RequestError:
-                    st.error("🚫 Google Speech Recognition service failed.")
+        # Hand each new recording to the STT pool exactly once
+        audio_id = getattr(audio_value, "file_id", None)
+        if audio_value is not None and audio_id != st.session_state.get('stt_audio_id'):
+            st.session_state.stt_audio_id = audio_id
+            pcm, rate = decode_wav(audio_value)
+            st.session_state.stt_future = get_stt_pool().submit(transcribe_answer, audio_value, pcm, rate)
+
+        # Poll the pending transcription across reruns
+        stt_future = st.session_state.get('stt_future')
+        if stt_future is not None:
+            if not stt_future.done():
+                with st.spinner("Transcribing and evaluating your answer..."):
+                    time.sleep(0.1)
+                rerun_panel()
+
+            del st.session_state.stt_future
+            try:
+                user_text = stt_future.result()
+            except sr.UnknownValueError:
+                st.warning("⚠️ Could not understand audio. Please try recording again.")
+            except sr.RequestError:
+                st.error("🚫 Google Speech Recognition service failed.")
+            except Exception as e: # e.g. the Whisper model failed to download or load
+                st.error(f"🚫 Transcription failed: {e}")
+            else:
+                # Update transcript with user's answer
+                st.session_state.transcript.append({"speaker": "User", "text": user_text})
+
+                # --- NEXT QUESTION LOGIC ---
+                st.session_state.question_index += 1
+                next_q = get_next_question(st.session_state.get('selected_mode', 'HR'), st.session_state.question_index)
+                
+                st.session_state.current_question = next_q
+                st.session_state.transcript.append({"speaker": "AI", "text": next_q})
+
+                # Rerun the panel to update the transcript with the new Q&A
+                rerun_panel()
 
     else:
         st.info("Click 'Start Interview' in the sidebar to load the first question.")
 
+with col2:
+    qa_panel()
+
 # --- END OF APP ---
\ No newline at end of file
@@ -5,27 +5,48 @@ AI-Powered Virtual Interview Practice with Advanced Features
 
 import streamlit as st
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from datetime import datetime
 import os
+import re
 import sys
-import traceback
 from io import BytesIO
 from pathlib import Path
 import shutil
+import hashlib
+import json
+import math
+import importlib
+import importlib.util
+import atexit
+import queue
 import logging
+import logging.handlers
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
+@st.cache_resource(show_spinner=False)
+def _log_queue_handler():
+    """Route log records through a queue so file/console writes happen on a background thread"""
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.FileHandler('app.log'),
+        logging.StreamHandler()
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    return logging.handlers.QueueHandler(log_queue)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_log_queue_handler()]
 )
 logger = logging.getLogger(__name__)
 
@@ -34,22 +55,150 @@ sys.path.append(os.path.dirname(__file__))
 
 # Import custom modules
 from modules.stt_engine import transcribe_audio
-from modules.nlp_evaluator import evaluate_answer
-from modules.tts_engine import TTSEngine, text_to_speech
 from modules.database import get_database
-from modules.report_generator import generate_report
-from modules.interview_flow import InterviewFlowManager
-try:
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except Exception:
-    PLOTLY_AVAILABLE = False
 
-# Page configuration
-st.set_page_config(page_title="AI Virtual Interview Coach", layout="wide")
-
-# Global styles for the application
-st.markdown("""
+# Heavier modules are imported on first use so the login page doesn't pay for them.
+# This script re-executes on every rerun, so no per-run cache is kept here;
+# once imported, a module is served from sys.modules.
+def _lazy_import(name: str):
+    """Import a module on first use; later calls are a sys.modules lookup"""
+    return importlib.import_module(name)
+
+def TTSEngine(*args, **kwargs):
+    """Construct modules.tts_engine.TTSEngine, importing it on first use"""
+    return _lazy_import('modules.tts_engine').TTSEngine(*args, **kwargs)
+
+def evaluate_answer(*args, **kwargs):
+    """Call modules.nlp_evaluator.evaluate_answer, importing it (and its NLP models) on first use"""
+    return _lazy_import('modules.nlp_evaluator').evaluate_answer(*args, **kwargs)
+
+def generate_report(*args, **kwargs):
+    """Call modules.report_generator.generate_report, importing it on first use"""
+    return _lazy_import('modules.report_generator').generate_report(*args, **kwargs)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_report(session_id: str, fmt: str, _session_data: dict, _analytics: dict, revision=None):
+    """Report built once per (session_id, format, revision); the data dicts aren't hashed.
+    Sessions that may still change pass a revision derived from their contents."""
+    return generate_report(_session_data, _analytics, format=fmt)
+
+def _report_file(session_id: str, fmt: str, session_data: dict, analytics: dict, revision=None) -> str:
+    """Path of a cached file report, regenerated if the file was removed since it was cached"""
+    path = _cached_report(session_id, fmt, session_data, analytics, revision=revision)
+    if not os.path.exists(path):
+        _cached_report.clear()
+        path = _cached_report(session_id, fmt, session_data, analytics, revision=revision)
+    return path
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _json_report(session_id: str, _session_data: dict, _analytics: dict, revision=None) -> bytes:
+    """JSON report encoded once per (session_id, revision), ready for st.download_button"""
+    return generate_report(_session_data, _analytics, format="json").encode('utf-8')
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_report_bytes(path: str, mtime: float) -> bytes:
+    """Contents of a generated report file; re-read from disk only when its mtime changes"""
+    return Path(path).read_bytes()
+
+def InterviewFlowManager(*args, **kwargs):
+    """Construct modules.interview_flow.InterviewFlowManager, importing it on first use"""
+    return _lazy_import('modules.interview_flow').InterviewFlowManager(*args, **kwargs)
+
+@st.cache_resource(show_spinner=False)
+def _tts(name: str):
+    """TTS engine shared by all sessions, built once per backend name"""
+    return TTSEngine(engine=name)
+
+# Plotly is only needed for the optional interactive radar; check it's installed
+# without importing it, and load it on first use
+PLOTLY_AVAILABLE = importlib.util.find_spec('plotly') is not None
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=64)
+def _feedback_audio(engine_name: str, feedback_key: str, _eval_data: dict):
+    """Spoken feedback for one evaluation, keyed by engine and a hash of the evaluation"""
+    engine = _tts(engine_name)
+    # generate_feedback_speech compiles the feedback into a single string
+    return engine.speak_text(engine.generate_feedback_speech(_eval_data))
+
+RADAR_CATEGORIES = ("Technical", "Communication", "Tone", "Completeness")
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _build_radar(tech: float, comm: float, tone: float, comp: float):
+    """Skill radar figure for one set of scores; reruns with the same scores reuse it"""
+    go = _lazy_import('plotly.graph_objects')
+    values = [tech, comm, tone, comp, tech]
+    fig = go.Figure(data=go.Scatterpolar(r=values, theta=list(RADAR_CATEGORIES) + [RADAR_CATEGORIES[0]], fill='toself', name='Skills'))
+    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0,100])), showlegend=False, height=350)
+    return fig
+
+def _radar_svg(values, size: int = 300) -> str:
+    """Skill radar as inline SVG: a few sin/cos per axis instead of a Plotly chart"""
+    pad = 70  # Horizontal room for the side labels
+    cx, cy, radius = size / 2 + pad, size / 2, size / 2 - 30
+    angles = [2 * math.pi * i / len(RADAR_CATEGORIES) - math.pi / 2 for i in range(len(RADAR_CATEGORIES))]
+    
+    def ring(fractions):
+        return " ".join(f"{cx + radius * f * math.cos(a):.1f},{cy + radius * f * math.sin(a):.1f}" for f, a in zip(fractions, angles))
+    
+    parts = [f"<svg viewBox='0 0 {size + 2 * pad} {size}' width='{size + 2 * pad}' height='{size}' xmlns='http://www.w3.org/2000/svg'>"]
+    for level in (0.25, 0.5, 0.75, 1.0):
+        parts.append(f"<polygon points='{ring([level] * len(angles))}' fill='none' stroke='#E2E8F0'/>")
+    for label, a in zip(RADAR_CATEGORIES, angles):
+        cos_a, sin_a = math.cos(a), math.sin(a)
+        anchor = "start" if cos_a > 0.3 else "end" if cos_a < -0.3 else "middle"
+        parts.append(f"<line x1='{cx}' y1='{cy}' x2='{cx + radius * cos_a:.1f}' y2='{cy + radius * sin_a:.1f}' stroke='#E2E8F0'/>")
+        parts.append(f"<text x='{cx + (radius + 8) * cos_a:.1f}' y='{cy + (radius + 14) * sin_a:.1f}' font-size='12' fill='#475569' text-anchor='{anchor}' dominant-baseline='middle'>{label}</text>")
+    scores = [min(max(v, 0), 100) / 100 for v in values]
+    parts.append(f"<polygon points='{ring(scores)}' fill='rgba(99,102,241,0.35)' stroke='#6366F1' stroke-width='2'/>")
+    parts.append("</svg>")
+    return "".join(parts)
+
+@st.cache_resource(show_spinner=False)
+def _db():
+    """Database handle shared across reruns and sessions for this server process"""
+    return get_database()
+
+@st.cache_resource(show_spinner=False)
+def _auth_salt() -> bytes:
+    """Per-process salt for auth cache keys, so raw passwords never become cache keys"""
+    return os.urandom(16)
+
+@st.cache_data(show_spinner=False, ttl=60, max_entries=512)
+def _auth(username: str, pw_key: str, _password: str):
+    """authenticate_user result per (username, salted password digest); cleared when users change"""
+    return _db().authenticate_user(username, _password)
+
+def authenticate(username: str, password: str):
+    """Check credentials through the short-lived auth cache"""
+    pw_key = hashlib.sha256(_auth_salt() + f"{username}\0{password}".encode()).hexdigest()
+    return _auth(username, pw_key, password)
+
+@st.cache_data(show_spinner=False, ttl=30, max_entries=512)
+def _verify_meeting(meeting_id: str) -> bool:
+    """verify_meeting result per meeting id; cleared when meetings are created or deleted"""
+    return _db().verify_meeting(meeting_id)
+
+@st.cache_resource(show_spinner=False)
+def _flow():
+    """Read-only flow manager for browsing the question bank; interviews get their own per session"""
+    return InterviewFlowManager()
+
+@st.cache_resource(show_spinner=False)
+def _tts_pool():
+    """Thread pool that synthesizes the next question's audio in the background;
+    kept to TTS only so it never queues ahead of anyone's answer evaluation"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts")
+
+# Keyword extraction patterns. This script re-executes on every rerun; re's own
+# pattern cache keeps re.compile from recompiling the expression each time.
+_KW_RE = re.compile(r"[A-Za-z][A-Za-z0-9_+-]{2,}")
+_STOP = frozenset({'the','and','for','with','this','that','from','your','about','you','are','our','will','have','has','can','use','using','in','on','of','to','a','an','as','be'})
+
+# Static stylesheets. Plain literals, so a rerun only rebinds them (Streamlit
+# reuses the script's compiled bytecode). They are still emitted on every
+# rerun: Streamlit drops any element a run doesn't re-emit, so a
+# once-per-session guard would strip the styles after the first interaction.
+_CSS = """
 <style>
 /* Reset and hide Streamlit elements */
 #MainMenu {visibility: hidden;}
@@ -209,8 +358,130 @@ button[kind="primary"]:hover {
     color: #2563eb;
     cursor: pointer;
 }
+
+/* Pre-interview wizard stepper */
+.wiz-step {
+    background: linear-gradient(90deg, #6366F1, #818CF8);
+    padding: .6rem 0;
+    border-radius: 12px;
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    opacity: 0.6;
+}
+
+.wiz-step.active {
+    opacity: 1;
+}
+
+.wiz-step-index {
+    background: #FFFFFF;
+    padding: .25rem .55rem;
+    border-radius: 20px;
+    font-size: .75rem;
+    font-weight: 600;
+    color: #6366F1;
+}
+
+.wiz-step-label {
+    margin-top: .35rem;
+    font-size: .75rem;
+    color: #FFFFFF;
+    font-weight: 500;
+}
+
+.wiz-step.active .wiz-step-label {
+    font-weight: 700;
+}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Results page skill breakdown: (label, analytics key) and the grid markup
+_SKILL_FIELDS = (
+    ('Technical Accuracy', 'technical_accuracy'),
+    ('Communication Skills', 'communication_skills'),
+    ('Sentiment & Tone', 'sentiment_tone'),
+    ('Completeness', 'completeness'),
+)
+_SKILL_GRID_OPEN = "<div style='display:grid;grid-template-columns:repeat(4,1fr);gap:1rem;'>"
+_SKILL_CELL = (
+    "<div>"
+    "<div style='font-size:.875rem;color:#6B7280;'>{name}</div>"
+    "<div style='font-size:1.75rem;font-weight:600;color:#111827;margin:.25rem 0 .5rem;'>{score:.1f}/100</div>"
+    "<div style='height:8px;background:#E2E8F0;border-radius:4px;overflow:hidden;'>"
+    "<div style='height:100%;width:{width}%;background:#6366F1;'></div></div>"
+    "</div>"
+)
+_METRIC_GRID_OPEN = "<div style='display:grid;grid-template-columns:repeat(5,1fr);gap:12px;'>"
+_METRIC_CELL = (
+    "<div>"
+    "<div style='color:#6B7280;font-size:.875rem;'>{label}</div>"
+    "<div style='font-size:1.75rem;font-weight:600;color:#111827;'>{score:.0f}</div>"
+    "</div>"
+)
+
+# Landing page greeting and feature cards; a static literal with no per-run formatting
+_LANDING_HTML = """
+<div class="greeting">
+    <h1>Hey 👋, <span>Friend!</span></h1>
+    <p>Let's get you ready for your next interview.</p>
+</div>
+<div class="dash-grid">
+    <div class="dash-card">
+        <span class="badge">REAL-TIME ASSIST</span>
+        <h3>Real-time Interview Assist</h3>
+        <p>Practice live with dynamic AI guidance. Tailored questions based on your resume and job description.</p>
+        <button class="primary-btn" onclick="document.getElementById('hero_start_btn_form_submit').click()">▶ Start Tailored Session</button>
+        <div class="link-sm">Upgrade to unlock unlimited</div>
+    </div>
+    <div class="dash-card">
+        <span class="badge" style="background:#DBEAFE;color:#1E3A8A;">HOW IT WORKS</span>
+        <h3>Interview Tab</h3>
+        <div class="tutorial-step"><div class="step-index">1</div><p>Start a tailored session via the wizard.</p></div>
+        <div class="tutorial-step"><div class="step-index">2</div><p>Use the input/mic to provide your answer.</p></div>
+        <div class="tutorial-step"><div class="step-index">3</div><p>Receive instant AI evaluation & guidance after each response.</p></div>
+        <p style="margin-top:1rem;font-size:.75rem;color:#64748B;">Finish all questions to unlock a detailed performance report.</p>
+    </div>
+    <div class="dash-card">
+        <span class="badge" style="background:#DCFCE7;color:#065F46;">RESOURCES</span>
+        <h3>Smart Prep & Library</h3>
+        <p>Explore curated question banks, role-specific context, and personalized improvement targets to accelerate readiness.</p>
+        <p style="margin-top:auto;font-size:.75rem;color:#64748B;">Coming soon – contextual boosters & company-specific packs.</p>
+    </div>
+</div>
+"""
+
+# Login page: hidden sidebar and centred role selector in one style block,
+# then the logo and role prompt as one element
+_LOGIN_CSS = """
+<style>
+[data-testid="stSidebar"] {
+    display: none;
+}
+div[role="radiogroup"] {
+    justify-content: center;
+}
+</style>
+"""
+
+_LOGIN_HEADER_HTML = """
+<div class="auth-logo">
+    <div class="logo-icon">
+        <svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+            <path d="M20 2H4c-1.1 0-2 .9-2 2v18l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2zm0 14H6l-2 2V4h16v12z"/>
+        </svg>
+    </div>
+    <h1>INTERVIEWS</h1>
+    <p>AI-Powered Interview Practice Platform</p>
+</div>
+<p style="text-align:center;font-weight:600;margin-bottom:0.5rem;color:#4B5563;">Please select your role:</p>
+"""
+
+# Page configuration
+st.set_page_config(page_title="AI Virtual Interview Coach", layout="wide")
+
+# Global styles for the application
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # ============================================================================
 # SESSION STATE INITIALIZATION
@@ -237,72 +508,79 @@ def ensure_data_directories():
                 st.stop()
                 
     except Exception as e:
-        logger.error(f"Critical error initializing data directories: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Critical error initializing data directories: {str(e)}")
         st.error("A critical error occurred while initializing the application. Please check the logs.")
         st.stop()
 
+# Session defaults. The script body runs afresh on every rerun, so the
+# mutable values here are never shared between sessions.
+_DEFAULTS = {
+    'logged_in': False,
+    'current_user': None,
+    'interview_started': False,
+    'wizard_active': False,
+    'wizard_step': 1,  # Start at step 1
+    'user_name': '',
+    'session_id': None,
+    'current_question': None,
+    'question_count': 0,
+    'transcript': [],
+    'evaluations': [],
+    'flow_manager': None,
+    'tts_engine_name': 'gtts',  # Initialize engine name first
+    'stt_engine_name': 'whisper',
+    'speak_next_question': False,
+    'session_complete': False,
+    'evaluation_metrics': {
+        'technical_accuracy': 0,
+        'communication_skills': 0,
+        'confidence': 0,
+        'clarity': 0,
+        'sentiment': 0
+    },
+    'role_name': '',
+    'candidate_first_name': '',
+    'job_description_text': '',
+    'resume_text': '',
+    'resume_pdf_bytes': None,
+    'extra_context': '',
+    'company_name': '', 
+    'show_connect_modal': False,
+    'processing': False,
+    'paused': False,
+    'show_feedback': False,
+    'transcription_text': '',
+    'error_message': '',
+    'setup_interview_mode': 'Technical',
+    'setup_difficulty': 'Intermediate',
+    'setup_num_questions': 5,
+    'question_start_time': None,
+    'current_evaluation': None,
+    'stt_metrics': {},
+    'gemini_api_key': os.getenv('GEMINI_API_KEY', '') 
+}
+
+@st.cache_resource(show_spinner=False)
+def _data_dirs_ready() -> bool:
+    """Run the directory check once per server process; a failed check stops the run and isn't cached"""
+    ensure_data_directories()
+    return True
+
 def initialize_session_state():
     """Initialize all session state variables"""
     
-    # First ensure data directories exist and are writable
-    ensure_data_directories()
-    
-    defaults = {
-        'logged_in': False,
-        'current_user': None,
-        'interview_started': False,
-        'wizard_active': False,
-        'wizard_step': 1,  # Start at step 1
-        'user_name': '',
-        'session_id': None,
-        'current_question': None,
-        'question_count': 0,
-        'transcript': [],
-        'evaluations': [],
-        'flow_manager': None,
-        'tts_engine_name': 'gtts',  # Initialize engine name first
-        'stt_engine_name': 'whisper',
-        'speak_next_question': False,
-        'session_complete': False,
-        'evaluation_metrics': {
-            'technical_accuracy': 0,
-            'communication_skills': 0,
-            'confidence': 0,
-            'clarity': 0,
-            'sentiment': 0
-        },
-        'role_name': '',
-        'candidate_first_name': '',
-        'job_description_text': '',
-        'resume_text': '',
-        'resume_pdf_bytes': None,
-        'extra_context': '',
-        'company_name': '', 
-        'show_connect_modal': False,
-        'processing': False,
-        'paused': False,
-        'show_feedback': False,
-        'transcription_text': '',
-        'error_message': '',
-        'setup_interview_mode': 'Technical',
-        'setup_difficulty': 'Intermediate',
-        'setup_num_questions': 5,
-        'question_start_time': None,
-        'current_evaluation': None,
-        'stt_metrics': {},
-        'gemini_api_key': os.getenv('GEMINI_API_KEY', '') 
-    }
+    # First ensure data directories exist and are writable (once per process)
+    _data_dirs_ready()
     
     # Initialize session state with defaults
-    for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    for key, value in _DEFAULTS.items():
+        st.session_state.setdefault(key, value)
     
-    # Initialize TTS engine separately to handle potential errors
-    if 'tts_engine' not in st.session_state:
+    # Initialize TTS engine separately to handle potential errors.
+    # Deferred until login so the auth page never loads the TTS backends.
+    if 'tts_engine' not in st.session_state and st.session_state.logged_in:
         try:
-            st.session_state.tts_engine = TTSEngine(engine=st.session_state.tts_engine_name)
+            st.session_state.tts_engine = _tts(st.session_state.tts_engine_name)
         except Exception as e:
             logger.error(f"Failed to initialize TTS engine: {str(e)}")
             st.session_state.tts_engine = None
@@ -314,52 +592,24 @@ initialize_session_state()
 # ============================================================================
 
 if not st.session_state.get('logged_in', False):
-    # Hide sidebar on login page
-    st.markdown("""
-    <style>
-    [data-testid="stSidebar"] {
-        display: none;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # Use columns to center the login card
-    col1, col2, col3 = st.columns([1, 2, 1])
-    
-    with col2:
-        # Logo and Header
-        st.markdown("""
-        <div class="auth-logo">
-            <div class="logo-icon">
-                <svg viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
-                    <path d="M20 2H4c-1.1 0-2 .9-2 2v18l4-4h14c1.1 0 2-.9 2-2V4c0-1.1-.9-2-2-2zm0 14H6l-2 2V4h16v12z"/>
-                </svg>
-            </div>
-            <h1>INTERVIEWS</h1>
-            <p>AI-Powered Interview Practice Platform</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Custom CSS for the role selector
-        st.markdown("""
-        <style>
-        div[role="radiogroup"] {
-            justify-content: center;
-        }
-        </style>
-        """, unsafe_allow_html=True)
+    # Hide sidebar and centre the role selector on the login page
+    st.markdown(_LOGIN_CSS, unsafe_allow_html=True)
 
+    @st.fragment
+    def _login_card():
+        """Role selector, panel selector and forms. Switching role or panel and failed submits rerun
+        only this card; a successful sign-in reruns the whole app."""
         # Role Selection
-        st.markdown('<p style="text-align:center;font-weight:600;margin-bottom:0.5rem;color:#4B5563;">Please select your role:</p>', unsafe_allow_html=True)
         role_options = ["Student / Candidate", "Interviewer / HR"]
         selected_role_label = st.radio("Role", role_options, horizontal=True, label_visibility="collapsed", index=0)
         
         # Tabs based on Role
         if role_options.index(selected_role_label) == 0: # Student
             st.markdown("---")
-            tab_join, tab_login, tab_register = st.tabs(["🔑 Join Meeting", "👤 Sign in", "📝 Sign up"])
+            # Radio instead of st.tabs so only the selected panel's form is built
+            panel = st.radio("Panel", ["🔑 Join Meeting", "👤 Sign in", "📝 Sign up"], horizontal=True, label_visibility="collapsed", key="student_login_panel")
             
-            with tab_join:
+            if panel == "🔑 Join Meeting":
                 st.info("Enter the Meeting ID provided by your interviewer to join a session directly.")
                 with st.form("join_meeting_form"):
                     display_name = st.text_input("Your Name", placeholder="Enter your full name")
@@ -368,22 +618,22 @@ if not st.session_state.get('logged_in', False):
                     st.markdown("<br>", unsafe_allow_html=True)
                     if st.form_submit_button("JOIN SESSION", type="primary", use_container_width=True):
                         if display_name and meeting_id:
-                            db = get_database()
-                            if db.verify_meeting(meeting_id):
-                                st.session_state.logged_in = True
-                                st.session_state.current_user = {"username": display_name, "full_name": display_name, "role": "student", "is_guest": True}
-                                st.session_state.user_name = display_name
-                                st.session_state.meeting_id = meeting_id
-                                st.session_state.interview_mode_override = "Meeting"
-                                st.success("✅ Joining session...")
-                                time.sleep(0.5)
+                            if _verify_meeting(meeting_id):
+                                st.session_state.update({
+                                    'logged_in': True,
+                                    'current_user': {"username": display_name, "full_name": display_name, "role": "student", "is_guest": True},
+                                    'user_name': display_name,
+                                    'meeting_id': meeting_id,
+                                    'interview_mode_override': "Meeting"
+                                })
+                                st.toast("Joining session...", icon="✅")
                                 st.rerun()
                             else:
                                 st.error("❌ Invalid or inactive Meeting ID")
                         else:
                             st.warning("⚠️ Please fill in all fields")
             
-            with tab_login:
+            elif panel == "👤 Sign in":
                 st.markdown('<p style="text-align:center;color:#334155;font-size:0.9rem;margin-bottom:1rem;">Login for Personal Practice</p>', unsafe_allow_html=True)
                 with st.form("student_login_form"):
                     username = st.text_input("Username", placeholder="Username")
@@ -391,22 +641,21 @@ if not st.session_state.get('logged_in', False):
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                     if st.form_submit_button("CONTINUE", type="primary", use_container_width=True):
-                        db = get_database()
-                        success, result = db.authenticate_user(username, password)
+                        success, result = authenticate(username, password)
                         if success:
                             # Verify role if possible, but for now allow access
-                            st.session_state.logged_in = True
-                            st.session_state.current_user = result
-                            st.session_state.user_name = result.get('full_name', username)
-                            if 'api_key' in result:
-                                st.session_state.gemini_api_key = result['api_key']
-                            st.success("✅ Sign in successful!")
-                            time.sleep(0.5)
+                            st.session_state.update({
+                                'logged_in': True,
+                                'current_user': result,
+                                'user_name': result.get('full_name', username),
+                                **({'gemini_api_key': result['api_key']} if 'api_key' in result else {})
+                            })
+                            st.toast("Sign in successful!", icon="✅")
                             st.rerun()
                         else:
                             st.error(f"❌ {result}")
 
-            with tab_register:
+            else:
                 st.markdown('<p style="text-align:center;color:#334155;font-size:0.9rem;margin-bottom:1rem;">Create a <strong>Student Account</strong> for self-paced practice.</p>', unsafe_allow_html=True)
                 with st.form("student_register_form"):
                     full_name = st.text_input("Full Name", placeholder="e.g. John Doe")
@@ -421,17 +670,18 @@ if not st.session_state.get('logged_in', False):
                             if new_pass != confirm_pass or len(new_pass) < 6:
                                 st.error("❌ Invalid password or mismatch")
                             else:
-                                db = get_database()
+                                db = _db()
                                 success, msg = db.register_user(new_user, new_pass, full_name, role="student", email=email)
                                 if success:
+                                    _auth.clear()
                                     st.success("✅ Account created! Please sign in.")
                                 else:
                                     st.error(f"❌ {msg}")
 
         else: # Interviewer
-            tab_login, tab_register = st.tabs(["Sign in", "Sign up"])
+            panel = st.radio("Panel", ["Sign in", "Sign up"], horizontal=True, label_visibility="collapsed", key="interviewer_login_panel")
             
-            with tab_login:
+            if panel == "Sign in":
                 st.markdown('<p style="text-align:center;color:#334155;font-size:0.9rem;margin-bottom:1rem;">Interviewer Access</p>', unsafe_allow_html=True)
                 with st.form("interviewer_login_form"):
                     username = st.text_input("Username", placeholder="Username")
@@ -439,22 +689,21 @@ if not st.session_state.get('logged_in', False):
                     
                     st.markdown("<br>", unsafe_allow_html=True)
                     if st.form_submit_button("CONTINUE", type="primary", use_container_width=True):
-                        db = get_database()
-                        success, result = db.authenticate_user(username, password)
+                        success, result = authenticate(username, password)
                         # Ideally check result['role'] == 'interviewer'
                         if success:
-                            st.session_state.logged_in = True
-                            st.session_state.current_user = result
-                            st.session_state.user_name = result.get('full_name', username)
-                            if 'api_key' in result:
-                                st.session_state.gemini_api_key = result['api_key']
-                            st.success("✅ Sign in successful!")
-                            time.sleep(0.5)
+                            st.session_state.update({
+                                'logged_in': True,
+                                'current_user': result,
+                                'user_name': result.get('full_name', username),
+                                **({'gemini_api_key': result['api_key']} if 'api_key' in result else {})
+                            })
+                            st.toast("Sign in successful!", icon="✅")
                             st.rerun()
                         else:
                             st.error(f"❌ {result}")
 
-            with tab_register:
+            else:
                 st.markdown('<p style="text-align:center;color:#334155;font-size:0.9rem;margin-bottom:1rem;">Create Interviewer Account</p>', unsafe_allow_html=True)
                 with st.form("interviewer_register_form"):
                     full_name = st.text_input("Full Name")
@@ -469,12 +718,21 @@ if not st.session_state.get('logged_in', False):
                             if new_pass != confirm_pass or len(new_pass) < 6:
                                 st.error("❌ Invalid password")
                             else:
-                                db = get_database()
+                                db = _db()
                                 success, msg = db.register_user(new_user, new_pass, full_name, role="interviewer")
                                 if success:
+                                    _auth.clear()
                                     st.success("✅ Account created! Please sign in.")
                                 else:
                                     st.error(f"❌ {msg}")
+
+    # Use columns to center the login card
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col2:
+        # Logo, header and role prompt
+        st.markdown(_LOGIN_HEADER_HTML, unsafe_allow_html=True)
+        _login_card()
     
     st.stop()  # Stop execution here if not logged in
 
@@ -482,76 +740,143 @@ if not st.session_state.get('logged_in', False):
 # HELPER: Start interview (reusable for sidebar + hero button)
 # ============================================================================
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def extract_keywords(text: str, limit: int = 25):
+    """Extract the most frequent keywords from job description + resume text for tailoring, cached per text"""
+    try:
+        counts = Counter(w for w in _KW_RE.findall(text.lower()) if w not in _STOP)
+        return [w for w,_ in counts.most_common(limit)]
+    except Exception as e:
+        logger.warning(f"Keyword extraction failed: {str(e)}")
+        return []
+
+RESUME_MAX_PAGES = 3  # Only the first 4000 characters are kept, which never needs more pages
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def extract_resume_text(pdf_hash: str, _pdf_bytes: bytes) -> str:
+    """Extract text from an uploaded resume PDF, cached by content hash (the bytes aren't rehashed)"""
+    # PyMuPDF (optional extra) is several times faster than pdfminer on plain resume text; pdfminer is the fallback
+    try:
+        fitz = _lazy_import('fitz')  # PyMuPDF
+        with fitz.open(stream=_pdf_bytes, filetype="pdf") as doc:
+            return "\n".join(doc[i].get_text() for i in range(min(doc.page_count, RESUME_MAX_PAGES)))
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning(f"PyMuPDF extraction failed, falling back to pdfminer: {str(e)}")
+    extract_text = _lazy_import('pdfminer.high_level').extract_text
+    return extract_text(BytesIO(_pdf_bytes), maxpages=RESUME_MAX_PAGES, caching=True)
+
+@st.cache_data(show_spinner=False, ttl=300, max_entries=64)
+def _session_and_analytics(session_id: str, db_version: int):
+    """A session and its analytics, read once per database version"""
+    db = _db()
+    return db.get_session(session_id), db.get_analytics(session_id)
+
+HISTORY_PAGE_SIZE = 10  # Questions shown per page in the history details table
+
+@st.cache_data(show_spinner=False, ttl=30)
+def _history_options(db_version: int) -> dict:
+    """Recent sessions as {session_id: label}; rebuilt only when the database version changes"""
+    # Display name includes the user's name if available, falling back to anonymous
+    return {
+        s['session_id']: f"{s['session_id']} | {s.get('user_name', 'Anonymous')} | {s['mode']} | {s['difficulty']} | {s['start_time'][:19]}"
+        for s in _db().get_recent_sessions(limit=20)
+    }
+
+@st.cache_data(show_spinner=False)
+def _preview_questions(mode: str, level: str) -> list:
+    """Question texts from the bank for the Settings preview, loaded once per filter pair"""
+    return [q['question'] for q in _flow().get_all_questions(mode, level)]
+
+@dataclass
+class SessionMeta:
+    """Candidate and job context stored with each interview session"""
+    company: str = ''
+    role: str = ''
+    candidate_first_name: str = ''
+    job_description: str = ''
+    resume_text: str = ''
+    extra_context: str = ''
+    has_resume_pdf: bool = False
+
+ERROR_LOG_INTERVAL = 5  # seconds between repeats of the same error in one session
+
+def _log_exception(msg: str, exc: BaseException):
+    """Log the exception being handled, traceback included. A persistent failure
+    repeats on every rerun, so each distinct error is logged at most once per
+    ERROR_LOG_INTERVAL for this session; other sessions keep their own record."""
+    last_logged = st.session_state.setdefault('_error_log_times', {})
+    key = (type(exc).__name__, str(exc))
+    now = time.monotonic()
+    if now - last_logged.get(key, float('-inf')) > ERROR_LOG_INTERVAL:
+        if len(last_logged) >= 128:
+            last_logged.clear()
+        last_logged[key] = now
+        logger.exception(msg)
+
 def start_interview_session(interview_mode: str, difficulty: str, num_questions: int, custom_questions: list = None):
     """Start a new interview session with proper validation and error handling"""
+    ss = st.session_state
     try:
         # Validate inputs
         if not all([interview_mode, difficulty, num_questions > 0]):
             raise ValueError("Missing required interview parameters")
             
         # Initialize flow manager if needed
-        if not hasattr(st.session_state, 'flow_manager') or not st.session_state.flow_manager:
-            st.session_state.flow_manager = InterviewFlowManager()
+        flow_manager = ss.get('flow_manager')
+        if not flow_manager:
+            flow_manager = ss.flow_manager = InterviewFlowManager()
+        
+        # Resume and job description are read once and reused below
+        resume = ss.get('resume_text', '') or ''
+        jd = ss.get('job_description_text', '') or ''
         
         # Extract keywords from job description + resume for tailoring
-        def extract_keywords(text: str, limit: int = 25):
-            try:
-                import re
-                words = re.findall(r"[A-Za-z][A-Za-z0-9_+-]{2,}", text.lower())
-                stop = set(['the','and','for','with','this','that','from','your','about','you','are','our','will','have','has','can','use','using','in','on','of','to','a','an','as','be'])
-                filtered = [w for w in words if w not in stop and len(w) > 2]
-                freq = {}
-                for w in filtered:
-                    freq[w] = freq.get(w,0)+1
-                ranked = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-                return [w for w,_ in ranked[:limit]]
-            except Exception as e:
-                logger.warning(f"Keyword extraction failed: {str(e)}")
-                return []
-                
-        combined_source = (st.session_state.get('job_description_text', '') or '') + '\n' + (st.session_state.get('resume_text', '') or '')
-        tailored_keywords = extract_keywords(combined_source)
+        tailored_keywords = extract_keywords(jd + '\n' + resume)
         
         # Start the session with resume and job description for custom question generation
-        st.session_state.flow_manager.start_session(
+        flow_manager.start_session(
             interview_mode, 
             difficulty, 
             num_questions, 
             target_keywords=tailored_keywords,
-            resume_text=st.session_state.get('resume_text', ''),
-            job_description=st.session_state.get('job_description_text', ''),
+            resume_text=resume,
+            job_description=jd,
             custom_questions_list=custom_questions,
-            api_key=st.session_state.get('gemini_api_key')
+            api_key=ss.get('gemini_api_key')
         )
         
         # Initialize database session
-        db = get_database()
-        meta = {
-            'company': st.session_state.get('company_name', ''),
-            'role': st.session_state.get('role_name', ''),
-            'candidate_first_name': st.session_state.get('candidate_first_name', ''),
-            'job_description': st.session_state.get('job_description_text', ''),
-            'resume_text': st.session_state.get('resume_text', ''),
-            'extra_context': st.session_state.get('extra_context', ''),
-            'has_resume_pdf': bool(st.session_state.get('resume_pdf_bytes'))
-        }
-        
-        # Create session in database
-        st.session_state.session_id = db.create_session(
-            interview_mode, 
-            difficulty, 
-            st.session_state.get('user_name', 'anonymous'),
-            metadata=meta,
-            meeting_id=st.session_state.get('meeting_id')
+        db = _db()
+        meta = SessionMeta(
+            company=ss.get('company_name', ''),
+            role=ss.get('role_name', ''),
+            candidate_first_name=ss.get('candidate_first_name', ''),
+            job_description=jd,
+            resume_text=resume,
+            extra_context=ss.get('extra_context', ''),
+            has_resume_pdf=bool(ss.get('resume_pdf_bytes'))
         )
         
         # Get first question
-        first_question = st.session_state.flow_manager.get_next_question()
+        first_question = flow_manager.get_next_question()
         if not first_question:
             raise ValueError("Failed to get first question - no questions available")
+        
+        # Create session in database, first question already logged, in one save
+        ss.session_id = db.create_session_with_initial_transcript(
+            interview_mode, 
+            difficulty, 
+            ss.get('user_name', 'anonymous'),
+            metadata=asdict(meta),
+            meeting_id=ss.get('meeting_id'),
+            initial_speaker='AI',
+            initial_text=first_question['question']
+        )
             
         # Update session state
-        st.session_state.update({
+        ss.update({
             'interview_mode': interview_mode,
             'difficulty': difficulty,
             'current_question': first_question,
@@ -565,246 +890,244 @@ def start_interview_session(interview_mode: str, difficulty: str, num_questions:
             'paused': False,
             'error_message': ''
         })
-
-        # DB Sync: Log first question
-        try:
-            db.append_transcript(st.session_state.session_id, 'AI', first_question['question'])
-        except Exception:
-            pass
         
         # Log the start of the interview
         logger.info(f"Interview started - Mode: {interview_mode}, Difficulty: {difficulty}")
         
     except Exception as e:
         error_msg = f"Failed to start interview: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
-        st.session_state.error_message = error_msg
+        _log_exception(error_msg, e)
+        ss.error_message = error_msg
         st.error(error_msg)
         return False
         
     return True
+
+# Interview-related session state cleared when a session ends
+_RESET_KEYS = frozenset({
+    'interview_started', 'session_complete', 'current_question',
+    'question_count', 'transcript', 'evaluations', 'current_evaluation',
+    'show_feedback', 'paused', 'session_id', 'flow_manager',
+    'interview_mode', 'difficulty', 'question_start_time'
+})
+
 def end_interview_session():
     """Safely end the current interview session and clean up resources"""
+    ss = st.session_state
     try:
         # End the session in the database if it exists
-        if st.session_state.get('session_id'):
+        session_id = ss.get('session_id')
+        if session_id:
             try:
-                db = get_database()
-                db.end_session(st.session_state.session_id)
-                logger.info(f"Successfully ended session {st.session_state.session_id}")
+                _db().end_session(session_id)
+                logger.info(f"Successfully ended session {session_id}")
             except Exception as e:
                 logger.error(f"Error ending session in database: {str(e)}")
         
         # Reset all interview-related session state
-        reset_keys = [
-            'interview_started', 'session_complete', 'current_question',
-            'question_count', 'transcript', 'evaluations', 'current_evaluation',
-            'show_feedback', 'paused', 'session_id', 'flow_manager',
-            'interview_mode', 'difficulty', 'question_start_time'
-        ]
-        
-        for key in reset_keys:
-            if key in st.session_state:
-                del st.session_state[key]
+        for key in _RESET_KEYS:
+            ss.pop(key, None)
                 
         logger.info("Interview session ended and cleaned up")
         
     except Exception as e:
         error_msg = f"Error ending interview session: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
+        _log_exception(error_msg, e)
         return False
         
     return True
 
-def get_next_question():
-    """Safely get the next question from the flow manager and update session state"""
-    if not st.session_state.get('flow_manager'):
-        st.error("Interview flow manager not initialized")
-        return False
-        
-    try:
-        # Get the next question from the flow manager
-        next_question = st.session_state.flow_manager.get_next_question()
-        
-        # If no more questions, end the interview
-        if not next_question:
-            st.session_state.session_complete = True
-            st.session_state.interview_started = False
-            st.rerun()
-            return False
-            
-        # Update session state with the new question
-        st.session_state.update({
-            'current_question': next_question,
-            'question_count': st.session_state.get('question_count', 0) + 1,
-            'question_start_time': time.time(),
-            'show_feedback': False,
-            'paused': False
-        })
-        
-        # Add the AI's question to the transcript
-        transcript_entry = {"speaker": "AI", "text": next_question['question']}
-        st.session_state.transcript = st.session_state.get('transcript', []) + [transcript_entry]
-        
-        # Log to database if session exists
-        if st.session_state.get('session_id'):
-            try:
-                db = get_database()
-                db.append_transcript(
-                    st.session_state.session_id, 
-                    'AI', 
-                    next_question['question']
-                )
-            except Exception as e:
-                logger.error(f"Error updating transcript: {str(e)}")
-        
-        return True
-        
-    except Exception as e:
-        error_msg = f"Failed to get next question: {str(e)}"
-        logger.error(error_msg)
-        logger.error(traceback.format_exc())
-        st.session_state.error_message = error_msg
-        return False
-
 # ============================================================================
 # SIDEBAR COMPONENT
 # ============================================================================
 
-def show_sidebar():
-    """Render the sidebar with navigation and session controls"""
+# Static pieces of the sidebar progress bar; only the numbers change per rerun
+_PROGRESS_PREFIX = """
+<div style='background:#EEF2FF;border:1px solid #E0E7FF;padding:.85rem 1rem;border-radius:14px;display:flex;align-items:center;gap:1rem;margin-bottom:1rem;'>
+    <div style='flex:1;height:10px;background:#E2E8F0;border-radius:8px;overflow:hidden;'>
+        <div style='height:100%;width:"""
+_PROGRESS_MID = """%;background:linear-gradient(90deg,#6366F1,#818CF8);transition:width .4s'></div>
+    </div>
+    <div style='font-size:.75rem;font-weight:600;color:#4F46E5;'>"""
+_PROGRESS_SUFFIX = """</div>
+</div>
+"""
+
+# Session keys read by the sidebar, snapshotted once per render
+_SIDEBAR_KEYS = (
+    'current_user', 'user_name', 'logged_in', 'meeting_id', 'created_meeting_id',
+    'interview_started', 'interview_mode', 'difficulty', 'session_complete',
+    'wizard_active', 'flow_manager', 'setup_interview_mode', 'setup_difficulty',
+    'setup_num_questions',
+)
+
+# Interview status blocks: heading and note go out as a single markdown element
+_STATUS_BOX = (
+    "<h3>{icon} {title}</h3>"
+    "<div style='background:{bg};color:{fg};padding:.75rem 1rem;border-radius:.5rem;margin-bottom:1rem;'>{body}</div>"
+)
+_STATUS_IN_PROGRESS_HTML = _STATUS_BOX.format(
+    icon="🎤", title="Interview in Progress", bg="#EEF2FF", fg="#3730A3",
+    body="<b>Mode:</b> {mode}<br><b>Difficulty:</b> {difficulty}",
+)
+_STATUS_COMPLETE_HTML = _STATUS_BOX.format(
+    icon="✅", title="Interview Complete", bg="#ECFDF5", fg="#065F46",
+    body="Your interview has been completed!",
+)
+_STATUS_WIZARD_HTML = _STATUS_BOX.format(
+    icon="📝", title="Setup Wizard Active", bg="#EEF2FF", fg="#3730A3",
+    body="Complete the wizard to start your interview with these settings.",
+)
+
+# Sidebar select options
+_MODE_OPTIONS = ("Technical", "HR", "Behavioral", "Mixed")
+_DIFF_OPTIONS = ("Beginner", "Intermediate", "Advanced")
+
+# Meeting sessions override the manual interview settings
+_MEETING_SETUP = {
+    'setup_interview_mode': "Mixed",
+    'setup_difficulty': "Intermediate",
+    'setup_num_questions': 5,
+}
+
+@st.fragment
+def _sidebar_fragment():
+    """Sidebar body. Runs as a fragment so sidebar widgets only rerun the sidebar;
+    actions that change the main page trigger a full st.rerun() explicitly."""
     try:
-        with st.sidebar:
-            st.markdown("## 🤖 AI Interview Coach")
+        # Read everything the sidebar needs from session state once; the
+        # proxy is only touched again for writes.
+        ss = st.session_state
+        markdown, button = st.markdown, st.button  # Bound once; called throughout the render
+        s = {k: ss.get(k) for k in _SIDEBAR_KEYS}
+        if not s['logged_in']:
+            return
+
+        markdown("## 🤖 AI Interview Coach")
+        
+        user_info = s['current_user'] or {}
+        user_role = user_info.get('role', 'student')
+        
+        if user_role == 'interviewer':
+            markdown("### 👨‍💼 Interviewer Dashboard")
+            st.info("You are logged in as an Interviewer.")
             
-            user_info = st.session_state.get('current_user', {})
-            user_role = user_info.get('role', 'student')
+            # Create Meeting Tool
+            with st.expander("Create New Meeting", expanded=True):
+                if button("Generate Meeting ID", type="primary"):
+                    db = _db()
+                    mid = db.create_meeting(s['user_name'])
+                    _verify_meeting.clear()
+                    ss.created_meeting_id = mid
+                    st.rerun()  # The main page also lists the new meeting
+                    
+            if s['created_meeting_id']:
+                st.success("Meeting ID Generated")
+                st.code(s['created_meeting_id'], language="text")
+                st.warning("Share this ID with your students.")
+
+        elif s['meeting_id']:
+            markdown("### 🎓 Student Session")
+            st.info(f"Connected to Meeting: **{s['meeting_id']}**")
             
-            if user_role == 'interviewer':
-                st.markdown("### 👨‍💼 Interviewer Dashboard")
-                st.info("You are logged in as an Interviewer.")
-                
-                # Create Meeting Tool
-                with st.expander("Create New Meeting", expanded=True):
-                    if st.button("Generate Meeting ID", type="primary"):
-                        db = get_database()
-                        mid = db.create_meeting(st.session_state.user_name)
-                        st.session_state.created_meeting_id = mid
-                        
-                if st.session_state.get('created_meeting_id'):
-                    st.success("Meeting ID Generated")
-                    st.code(st.session_state.created_meeting_id, language="text")
-                    st.warning("Share this ID with your students.")
-
-            elif st.session_state.get('meeting_id'):
-                st.markdown("### 🎓 Student Session")
-                st.info(f"Connected to Meeting: **{st.session_state.meeting_id}**")
-                
-                # Meeting Logic overrides manual settings
-                st.session_state.setup_interview_mode = "Mixed" # Default for meetings
-                st.session_state.setup_difficulty = "Intermediate"
-                st.session_state.setup_num_questions = 5
+            # Meeting Logic overrides manual settings
+            for key, value in _MEETING_SETUP.items():
+                if s[key] != value:
+                    ss[key] = value
 
-            else:
-                # Standard Practice Mode (Existing Sidebar)
-                st.markdown("### ⚙️ Interview Settings")
-                
-                # Interview Mode Selection
-                interview_mode_options = ["Technical", "HR", "Behavioral", "Mixed"]
-                current_mode = st.session_state.get('setup_interview_mode', 'Technical')
-                mode_index = interview_mode_options.index(current_mode) if current_mode in interview_mode_options else 0
-                
-                selected_mode = st.selectbox(
+        else:
+            # Standard Practice Mode (Existing Sidebar)
+            markdown("### ⚙️ Interview Settings")
+            
+            # The widgets own the setup_* keys directly (seeded in _DEFAULTS),
+            # so no index/value defaults and no mirrored writes are needed.
+            # Inside a form, the keys only change (and the sidebar only reruns)
+            # when Apply is pressed, however many settings were edited.
+            with st.form("setup_form", border=False):
+                st.selectbox(
                     "Interview Type",
-                    interview_mode_options,
-                    index=mode_index,
-                    key="sidebar_interview_mode",
+                    _MODE_OPTIONS,
+                    key="setup_interview_mode",
                     help="Select the type of interview questions"
                 )
-                st.session_state.setup_interview_mode = selected_mode
                 
-                # Difficulty Level Selection
-                difficulty_options = ["Beginner", "Intermediate", "Advanced"]
-                current_diff = st.session_state.get('setup_difficulty', 'Intermediate')
-                diff_index = difficulty_options.index(current_diff) if current_diff in difficulty_options else 1
-                
-                selected_difficulty = st.selectbox(
+                st.selectbox(
                     "Difficulty Level",
-                    difficulty_options,
-                    index=diff_index,
-                    key="sidebar_difficulty",
+                    _DIFF_OPTIONS,
+                    key="setup_difficulty",
                     help="Select the difficulty level of questions"
                 )
-                st.session_state.setup_difficulty = selected_difficulty
                 
-                # Number of Questions
-                num_questions = st.slider(
+                st.slider(
                     "Number of Questions",
                     min_value=3,
                     max_value=15,
-                    value=st.session_state.get('setup_num_questions', 5),
                     step=1,
-                    key="sidebar_num_questions",
+                    key="setup_num_questions",
                     help="Total questions in the interview"
                 )
-                st.session_state.setup_num_questions = num_questions
-            
-            st.markdown("---")
+                
+                st.form_submit_button("Apply", use_container_width=True)
+        
+        markdown("---")
+        
+        # Show interview status
+        if s['interview_started']:
+            markdown(
+                _STATUS_IN_PROGRESS_HTML.format(mode=s['interview_mode'], difficulty=s['difficulty']),
+                unsafe_allow_html=True,
+            )
             
-            # Show interview status
-            if st.session_state.interview_started:
-                st.markdown(f"### 🎤 Interview in Progress")
-                st.info(f"**Mode:** {st.session_state.interview_mode}  \n**Difficulty:** {st.session_state.difficulty}")
+            if button("⏸️ Pause Interview", use_container_width=True):
+                ss.paused = True
+                st.rerun()
                 
-                if st.button("⏸️ Pause Interview", use_container_width=True):
-                    st.session_state.paused = True
-                    st.rerun()
-                    
-                if st.button("⏹️ End Interview", type="primary", use_container_width=True):
-                    if end_interview_session():
-                        st.success("Interview session ended successfully")
-                    else:
-                        st.error("Failed to end interview session. Please check the logs.")
-                    st.rerun()
-                    
-            elif st.session_state.get('session_complete'):
-                st.markdown("### ✅ Interview Complete")
-                st.success("Your interview has been completed!")
+            if button("⏹️ End Interview", type="primary", use_container_width=True):
+                if end_interview_session():
+                    st.success("Interview session ended successfully")
+                else:
+                    st.error("Failed to end interview session. Please check the logs.")
+                st.rerun()
                 
-            elif st.session_state.get('wizard_active', False):
-                st.markdown("### 📝 Setup Wizard Active")
-                st.info("Complete the wizard to start your interview with these settings.")
-            
-            st.markdown("---")
+        elif s['session_complete']:
+            markdown(_STATUS_COMPLETE_HTML, unsafe_allow_html=True)
             
-            # Progress indicator (only show during interview)
-            if st.session_state.get('interview_started') and st.session_state.get('flow_manager'):
-                progress = st.session_state.flow_manager.get_progress()
+        elif s['wizard_active']:
+            markdown(_STATUS_WIZARD_HTML, unsafe_allow_html=True)
+        
+        markdown("---")
+        
+        # Progress indicator (only show during interview)
+        if s['interview_started'] and s['flow_manager']:
+            # Progress only moves when the flow manager's version ticks, so
+            # get_progress() and the bar HTML are rebuilt only then
+            flow_manager = s['flow_manager']
+            progress_key = (flow_manager.uid, flow_manager.version)
+            if ss.get('_progress_key') != progress_key:
+                progress = flow_manager.get_progress()
                 progress_pct = progress.get('progress_percentage', 0)
                 current_q = progress.get('current_question', 0)
                 total_q = progress.get('total_questions', 0)
-                st.markdown(f"""
-<div style='background:#EEF2FF;border:1px solid #E0E7FF;padding:.85rem 1rem;border-radius:14px;display:flex;align-items:center;gap:1rem;margin-bottom:1rem;'>
-    <div style='flex:1;height:10px;background:#E2E8F0;border-radius:8px;overflow:hidden;'>
-        <div style='height:100%;width:{progress_pct}%;background:linear-gradient(90deg,#6366F1,#818CF8);transition:width .4s'></div>
-    </div>
-    <div style='font-size:.75rem;font-weight:600;color:#4F46E5;'>{current_q} / {total_q}</div>
-</div>
-""", unsafe_allow_html=True)
-            
-            # User info and logout
-            if st.session_state.get('logged_in'):
-                st.markdown(f"👤 **{st.session_state.get('user_name', 'User')}**")
-                if st.button("🔓 Logout", use_container_width=True):
-                    st.session_state.logged_in = False
-                    st.rerun()
-                    
+                ss._progress_key = progress_key
+                ss._progress_html = f"{_PROGRESS_PREFIX}{progress_pct}{_PROGRESS_MID}{current_q} / {total_q}{_PROGRESS_SUFFIX}"
+            markdown(ss._progress_html, unsafe_allow_html=True)
+        
+        # User info and logout
+        markdown(f"👤 **{s['user_name'] or 'User'}**")
+        if button("🔓 Logout", use_container_width=True):
+            ss.logged_in = False
+            _auth.clear()
+            st.rerun()
     except Exception as e:
-        logger.error(f"Error in sidebar: {str(e)}")
-        logger.error(traceback.format_exc())
-        st.sidebar.error("An error occurred in the sidebar. Please refresh the page.")
+        _log_exception(f"Error in sidebar: {e}", e)
+        st.error("An error occurred in the sidebar. Please refresh the page.")
+
+
+def show_sidebar():
+    """Render the sidebar with navigation and session controls"""
+    # Fragments render into st.sidebar only when called inside it
+    with st.sidebar:
+        _sidebar_fragment()
 
 # ============================================================================
 # MAIN HEADER (Only shown when logged in)
@@ -821,6 +1144,7 @@ if st.session_state.get('logged_in', False):
 tab_interview, tab_history, tab_settings, tab_about = st.tabs(["🗣️ Interview", "📚 History", "⚙️ Settings", "ℹ️ About"])
 
 with tab_interview:
+    db = _db()  # One handle for every branch of the interview tab
     user_role = st.session_state.get('current_user', {}).get('role', 'student')
 
     if user_role == 'interviewer':
@@ -847,8 +1171,8 @@ with tab_interview:
                 st.markdown("<br>", unsafe_allow_html=True)
                 if st.button("Generate Meeting ID", type="primary"):
                     mode_code = "live" if "Live" in meeting_type else "async"
-                    db = get_database()
                     mid = db.create_meeting(st.session_state.user_name, meeting_type=mode_code, custom_questions=custom_questions)
+                    _verify_meeting.clear()
                     st.session_state.created_meeting_id = mid
                 
         if st.session_state.get('created_meeting_id'):
@@ -870,7 +1194,6 @@ with tab_interview:
             if st.button("🔄 Refresh Data", use_container_width=True):
                 st.rerun()
 
-        db = get_database()
         
         # Reload meetings to ensure we see newly created ones or updates
         if not db.use_mongo:
@@ -898,8 +1221,8 @@ with tab_interview:
                     st.warning(f"Deleting meeting **{selected_meeting_id}** will prevent students from joining it.")
                     if st.button("🗑️ Delete This Meeting", type="secondary", key=f"del_{selected_meeting_id}"):
                         if db.delete_meeting(selected_meeting_id):
-                            st.success(f"Meeting {selected_meeting_id} deleted.")
-                            time.sleep(1)
+                            _verify_meeting.clear()
+                            st.toast(f"Meeting {selected_meeting_id} deleted.", icon="🗑️")
                             st.rerun()
                         else:
                             st.error("Failed to delete meeting.")
@@ -1016,32 +1339,28 @@ with tab_interview:
                                         c_eval1, c_eval2 = st.columns(2)
                                         with c_eval1:
                                             if st.button("✅ Select & Email", key=f"sel_{session.get('session_id')}", type="primary"):
-                                                db = get_database()
                                                 # Update Status
                                                 db.update_session_status(session.get('session_id'), 'reviewed', selection_result="Selected")
                                                 
                                                 # Send Email
                                                 user_email = session.get('user_email', 'candidate@example.com')
                                                 with st.spinner(f"Sending offer email to {user_email}..."):
-                                                    time.sleep(1.0)
                                                     db.update_session_status(session.get('session_id'), 'reviewed', email_sent=True)
                                                 
-                                                st.success("Candidate SELECTED and Email SENT.")
+                                                st.toast("Candidate SELECTED and Email SENT.", icon="✅")
                                                 st.rerun()
 
                                         with c_eval2:
                                             if st.button("❌ Reject & Email", key=f"rej_{session.get('session_id')}"):
-                                                db = get_database()
                                                 # Update Status
                                                 db.update_session_status(session.get('session_id'), 'reviewed', selection_result="Rejected")
                                                 
                                                 # Send Email
                                                 user_email = session.get('user_email', 'candidate@example.com')
                                                 with st.spinner(f"Sending rejection email to {user_email}..."):
-                                                    time.sleep(1.0)
                                                     db.update_session_status(session.get('session_id'), 'reviewed', email_sent=True)
                                                 
-                                                st.warning("Candidate REJECTED and Email SENT.")
+                                                st.toast("Candidate REJECTED and Email SENT.", icon="❌")
                                                 st.rerun()
                                         
                                         # Status Display
@@ -1074,7 +1393,6 @@ with tab_interview:
              st.session_state.role_name = "Student"
              
              # Check for custom questions in meeting
-             db = get_database()
              meetings = getattr(db, 'meetings', {})
              meeting_data = meetings.get(st.session_state.meeting_id, {})
              custom_qs = meeting_data.get('custom_questions', [])
@@ -1090,55 +1408,13 @@ with tab_interview:
              if st.session_state.get('session_id') and st.session_state.get('student_email'):
                  # We need a way to store this email. For now, let's piggyback on update
                  if st.session_state.get('session_id'):
-                     get_database().update_session_status(st.session_state.session_id, 'active', user_email=st.session_state.student_email)
+                     db.update_session_status(st.session_state.session_id, 'active', user_email=st.session_state.student_email)
 
              st.rerun()
 
     elif not st.session_state.interview_started and not st.session_state.wizard_active:
-        # Redesigned landing (hero + cards)
-        st.markdown("""
-        <div class="greeting">
-            <h1>Hey 👋, <span>Friend!</span></h1>
-            <p>Let's get you ready for your next interview.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown('<div class="dash-grid">', unsafe_allow_html=True)
-
-        # Card 1: Real-time Assist
-        st.markdown(f"""
-        <div class="dash-card">
-            <span class="badge">REAL-TIME ASSIST</span>
-            <h3>Real-time Interview Assist</h3>
-            <p>Practice live with dynamic AI guidance. Tailored questions based on your resume and job description.</p>
-            <button class="primary-btn" onclick="document.getElementById('hero_start_btn_form_submit').click()">▶ Start Tailored Session</button>
-            <div class="link-sm">Upgrade to unlock unlimited</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Card 2: Tutorial / Steps
-        st.markdown("""
-        <div class="dash-card">
-            <span class="badge" style="background:#DBEAFE;color:#1E3A8A;">HOW IT WORKS</span>
-            <h3>Interview Tab</h3>
-            <div class="tutorial-step"><div class="step-index">1</div><p>Start a tailored session via the wizard.</p></div>
-            <div class="tutorial-step"><div class="step-index">2</div><p>Use the input/mic to provide your answer.</p></div>
-            <div class="tutorial-step"><div class="step-index">3</div><p>Receive instant AI evaluation & guidance after each response.</p></div>
-            <p style="margin-top:1rem;font-size:.75rem;color:#64748B;">Finish all questions to unlock a detailed performance report.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        # Card 3: Placeholder for future features / context library
-        st.markdown("""
-        <div class="dash-card">
-            <span class="badge" style="background:#DCFCE7;color:#065F46;">RESOURCES</span>
-            <h3>Smart Prep & Library</h3>
-            <p>Explore curated question banks, role-specific context, and personalized improvement targets to accelerate readiness.</p>
-            <p style="margin-top:auto;font-size:.75rem;color:#64748B;">Coming soon – contextual boosters & company-specific packs.</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Redesigned landing (hero + cards), sent as one element
+        st.markdown(_LANDING_HTML, unsafe_allow_html=True)
 
         # Actual Streamlit button logic to start the wizard
         with st.form(key="hero_start_form"):
@@ -1158,58 +1434,66 @@ with tab_interview:
         for idx, (col, label) in enumerate(zip(step_cols, steps), start=1):
             active = idx == current
             with col:
-                st.markdown(f"<div style='background:linear-gradient(90deg,#6366F1,#818CF8);padding:.6rem 0;border-radius:12px;display:flex;flex-direction:column;align-items:center;opacity:{'1' if active else '0.6'}'>"
-                            f"<div style='background:#FFFFFF;padding:.25rem .55rem;border-radius:20px;font-size:.75rem;font-weight:600;color:#6366F1'>{idx}</div>"
-                            f"<div style='margin-top:.35rem;font-size:.75rem;color:#FFFFFF;font-weight:{'700' if active else '500'}'>{label}</div></div>", unsafe_allow_html=True)
+                st.markdown(f"<div class='wiz-step{' active' if active else ''}'><div class='wiz-step-index'>{idx}</div>"
+                            f"<div class='wiz-step-label'>{label}</div></div>", unsafe_allow_html=True)
 
         st.markdown("<div style='height:1.2rem'></div>", unsafe_allow_html=True)
 
-        # Render current step
+        # Render current step. Each step's inputs live in a form so typing
+        # doesn't rerun the script; values are saved when a nav button submits.
         if current == 1:
             st.markdown("## Tell us about the job you're interviewing for •")
-            company = st.text_input("Company *", value=st.session_state.get('company_name', ''), placeholder="Select or enter company name...", key="wiz_company")
-            role = st.text_input("Role *", value=st.session_state.get('role_name', ''), placeholder="Select or enter job role...", key="wiz_role")
-            first_name = st.text_input("First Name *", value=st.session_state.get('candidate_first_name', '') or st.session_state.get('user_name', ''), key="wiz_name")
-            
-            # Update session state
-            st.session_state.company_name = company
-            st.session_state.role_name = role
-            st.session_state.candidate_first_name = first_name
+            with st.form("wiz_step_1_form"):
+                company = st.text_input("Company *", value=st.session_state.get('company_name', ''), placeholder="Select or enter company name...", key="wiz_company")
+                role = st.text_input("Role *", value=st.session_state.get('role_name', ''), placeholder="Select or enter job role...", key="wiz_role")
+                first_name = st.text_input("First Name *", value=st.session_state.get('candidate_first_name', '') or st.session_state.get('user_name', ''), key="wiz_name")
+                
+                nav_cols = st.columns([1,1,6])
+                with nav_cols[0]:
+                    next_clicked = st.form_submit_button("Next ➜", use_container_width=True, key="wiz1_next")
             
-            nav_cols = st.columns([1,1,6])
-            with nav_cols[0]:
-                is_valid = bool(company and role and first_name)
-                if st.button("Next ➜", use_container_width=True, disabled=not is_valid, key="wiz1_next"):
+            if next_clicked:
+                # Update session state
+                st.session_state.company_name = company
+                st.session_state.role_name = role
+                st.session_state.candidate_first_name = first_name
+                if company and role and first_name:
                     st.session_state.wizard_step = 2
                     st.rerun()
+                st.error("Please fill in the company, role and your first name.")
                     
         elif current == 2:
             st.markdown("## Provide the job description •")
-            job_desc = st.text_area("Paste Job Description", value=st.session_state.get('job_description_text', ''), height=260, placeholder="Paste the full job description here...", key="wiz_job_desc")
-            st.session_state.job_description_text = job_desc
+            with st.form("wiz_step_2_form"):
+                job_desc = st.text_area("Paste Job Description", value=st.session_state.get('job_description_text', ''), height=260, placeholder="Paste the full job description here...", key="wiz_job_desc")
+                
+                nav_cols = st.columns([1,1,6])
+                with nav_cols[0]:
+                    back_clicked = st.form_submit_button("◀ Back", use_container_width=True, key="wiz2_back")
+                with nav_cols[1]:
+                    next_clicked = st.form_submit_button("Next ➜", use_container_width=True, key="wiz2_next")
             
-            nav_cols = st.columns([1,1,6])
-            with nav_cols[0]:
-                if st.button("◀ Back", use_container_width=True, key="wiz2_back"):
+            if back_clicked or next_clicked:
+                st.session_state.job_description_text = job_desc
+                if back_clicked:
                     st.session_state.wizard_step = 1
                     st.rerun()
-            with nav_cols[1]:
-                is_valid = len(job_desc.strip()) >= 30
-                if st.button("Next ➜", use_container_width=True, disabled=not is_valid, key="wiz2_next"):
+                if len(job_desc.strip()) >= 30:
                     st.session_state.wizard_step = 3
                     st.rerun()
+                st.error("The job description should be at least 30 characters.")
                     
         elif current == 3:
             st.markdown("## Ok... now about you (professionally) •")
             st.write("Upload resume or tell us about your prior experience (max 4,000 char)")
+            # The uploader stays outside the form so a new PDF can prefill the text below
             uploaded_pdf = st.file_uploader("Upload Resume (PDF)", type=["pdf"], help="Drag & drop or browse your PDF resume", key="wiz_resume_upload")
             if uploaded_pdf is not None:
-                st.session_state.resume_pdf_bytes = uploaded_pdf.read()
-                # Try PDF text extraction if library available
+                pdf_bytes = uploaded_pdf.getvalue()
+                st.session_state.resume_pdf_bytes = pdf_bytes
+                # Try PDF text extraction if library available; reruns reuse the cached text
                 try:
-                    from pdfminer.high_level import extract_text  # type: ignore
-                    from io import BytesIO as _BIO
-                    pdf_text = extract_text(_BIO(st.session_state.resume_pdf_bytes))
+                    pdf_text = extract_resume_text(hashlib.md5(pdf_bytes).hexdigest(), pdf_bytes)
                     if pdf_text and len(pdf_text.strip()) > 0:
                         # Only auto-fill if user hasn't typed anything yet
                         if not st.session_state.get('resume_text', '').strip():
@@ -1219,53 +1503,55 @@ with tab_interview:
                         st.success("Resume uploaded ✔ (no extractable text)")
                 except Exception:
                     st.success("Resume uploaded ✔ (text extraction unavailable)")
-                    
-            resume_text = st.text_area("Paste Your Resume / Experience Text Here", value=st.session_state.get('resume_text', ''), height=220, max_chars=4000, key="wiz_resume_text")
-            st.session_state.resume_text = resume_text
-            st.caption(f"{len(resume_text)} / 4000 characters")
             
-            nav_cols = st.columns([1,1,1,5])
-            with nav_cols[0]:
-                if st.button("◀ Back", use_container_width=True, key="wiz3_back"):
-                    st.session_state.wizard_step = 2
-                    st.rerun()
-            with nav_cols[1]:
-                if st.button("Skip", use_container_width=True, key="wiz3_skip"):
-                    st.session_state.wizard_step = 4
-                    st.rerun()
-            with nav_cols[2]:
-                if st.button("Next ➜", use_container_width=True, key="wiz3_next"):
-                    st.session_state.wizard_step = 4
-                    st.rerun()
+            with st.form("wiz_step_3_form"):
+                # max_chars shows the live character counter
+                resume_text = st.text_area("Paste Your Resume / Experience Text Here", value=st.session_state.get('resume_text', ''), height=220, max_chars=4000, key="wiz_resume_text")
+                
+                nav_cols = st.columns([1,1,1,5])
+                with nav_cols[0]:
+                    back_clicked = st.form_submit_button("◀ Back", use_container_width=True, key="wiz3_back")
+                with nav_cols[1]:
+                    skip_clicked = st.form_submit_button("Skip", use_container_width=True, key="wiz3_skip")
+                with nav_cols[2]:
+                    next_clicked = st.form_submit_button("Next ➜", use_container_width=True, key="wiz3_next")
+            
+            if back_clicked or skip_clicked or next_clicked:
+                st.session_state.resume_text = resume_text
+                st.session_state.wizard_step = 2 if back_clicked else 4
+                st.rerun()
                     
         elif current == 4:
             st.markdown("## Extra Context •")
-            extra = st.text_area("Add any extra notes (optional)", value=st.session_state.get('extra_context', ''), height=160, key="wiz_extra")
-            st.session_state.extra_context = extra
+            with st.form("wiz_step_4_form"):
+                extra = st.text_area("Add any extra notes (optional)", value=st.session_state.get('extra_context', ''), height=160, key="wiz_extra")
+                
+                nav_cols = st.columns([1,1,6])
+                with nav_cols[0]:
+                    back_clicked = st.form_submit_button("◀ Back", use_container_width=True, key="wiz4_back")
+                with nav_cols[1]:
+                    start_clicked = st.form_submit_button("Start Interview ▶", use_container_width=True, key="wiz4_start")
             
-            nav_cols = st.columns([1,1,6])
-            with nav_cols[0]:
-                if st.button("◀ Back", use_container_width=True, key="wiz4_back"):
-                    st.session_state.wizard_step = 3
-                    st.rerun()
-            with nav_cols[1]:
-                if st.button("Start Interview ▶", use_container_width=True, key="wiz4_start"):
-                    # Now actually start real interview using sidebar settings
-                    st.session_state.wizard_active = False # Exit wizard
-                    start_interview_session(
-                        interview_mode=st.session_state.get('setup_interview_mode', 'Technical'),
-                        difficulty=st.session_state.get('setup_difficulty', 'Intermediate'),
-                        num_questions=st.session_state.get('setup_num_questions', 5)
-                    )
+            if back_clicked or start_clicked:
+                st.session_state.extra_context = extra
+            if back_clicked:
+                st.session_state.wizard_step = 3
+                st.rerun()
+            if start_clicked:
+                # Now actually start real interview using sidebar settings
+                st.session_state.wizard_active = False # Exit wizard
+                start_interview_session(
+                    interview_mode=st.session_state.get('setup_interview_mode', 'Technical'),
+                    difficulty=st.session_state.get('setup_difficulty', 'Intermediate'),
+                    num_questions=st.session_state.get('setup_num_questions', 5)
+                )
 
     elif st.session_state.session_complete:
         # Session complete - show results
         st.markdown("## 🎉 Interview Session Complete!")
 
         if st.session_state.session_id:
-            db = get_database()
-            session_data = db.get_session(st.session_state.session_id)
-            analytics = db.get_analytics(st.session_state.session_id)
+            session_data, analytics = _session_and_analytics(st.session_state.session_id, db.version)
             
             # Overall score
             overall_score = session_data['overall_score']
@@ -1291,16 +1577,13 @@ with tab_interview:
             # Skill breakdown
             st.markdown("### 📊 Skill Breakdown")
             
-            skill_cols = st.columns(4)
+            # Four score cells with inline bars, sent as a single element
             skills = analytics['skill_breakdown']
-            skill_names = ['Technical Accuracy', 'Communication Skills', 'Sentiment & Tone', 'Completeness']
-            skill_keys = ['technical_accuracy', 'communication_skills', 'sentiment_tone', 'completeness']
-            
-            for col, name, key in zip(skill_cols, skill_names, skill_keys):
-                with col:
-                    score = skills[key]
-                    st.metric(name, f"{score:.1f}/100")
-                    st.progress(score / 100)
+            cells = "".join(
+                _SKILL_CELL.format(name=name, score=skills[key], width=min(max(skills[key], 0), 100))
+                for name, key in _SKILL_FIELDS
+            )
+            st.markdown(f"{_SKILL_GRID_OPEN}{cells}</div>", unsafe_allow_html=True)
             
             st.markdown("---")
             
@@ -1314,20 +1597,19 @@ with tab_interview:
                     with st.spinner("Generating PDF report..."):
                         try:
                             # Note: This requires the fpdf library (fpdf2)
-                            report_path = generate_report(session_data, analytics, format="pdf")
+                            report_path = _report_file(st.session_state.session_id, "pdf", session_data, analytics)
                             
                             if os.path.exists(report_path):
-                                with open(report_path, 'rb') as f:
-                                    st.download_button(
-                                        label="Download PDF",
-                                        data=f.read(),
-                                        file_name=f"interview_report_{st.session_state.session_id}.pdf",
-                                        mime="application/pdf",
-                                        use_container_width=True
-                                    )
+                                st.download_button(
+                                    label="Download PDF",
+                                    data=_read_report_bytes(report_path, os.path.getmtime(report_path)),
+                                    file_name=f"interview_report_{st.session_state.session_id}.pdf",
+                                    mime="application/pdf",
+                                    use_container_width=True
+                                )
                             else:
                                 st.warning("PDF generation requires fpdf library. Generating text report instead.")
-                                report_path = generate_report(session_data, analytics, format="txt")
+                                report_path = _report_file(st.session_state.session_id, "txt", session_data, analytics)
                                 with open(report_path, 'r', encoding='utf-8') as f:
                                     st.download_button(
                                         label="Download Text Report",
@@ -1341,7 +1623,7 @@ with tab_interview:
             
             with col2:
                 # JSON report
-                json_report = generate_report(session_data, analytics, format="json")
+                json_report = _json_report(st.session_state.session_id, session_data, analytics)
                 st.download_button(
                     label="📥 Download JSON Data",
                     data=json_report,
@@ -1370,13 +1652,20 @@ with tab_interview:
         def _process_answer(user_answer: str, stt_result_meta: dict):
             # 1. Update Transcript
             st.session_state.transcript.append({'speaker':'User','text': user_answer})
-            if st.session_state.session_id:
-                try:
-                    get_database().append_transcript(st.session_state.session_id, 'User', user_answer)
-                except Exception:
-                    pass
             
-            # 2. Evaluate Answer
+            # 2. Pick the next question (a local pool lookup) and start synthesizing its
+            # audio in the background; the TTS worker only gets plain arguments,
+            # never st.session_state.
+            flow_manager = st.session_state.flow_manager
+            flow_manager.current_session['last_answer'] = user_answer # Store for follow up
+            next_question = flow_manager.get_next_question()
+            tts_engine = st.session_state.get('tts_engine')
+            if next_question and tts_engine:
+                st.session_state.next_tts = (
+                    next_question['question'],
+                    _tts_pool().submit(tts_engine.speak_text, next_question['question'])
+                )
+            # Evaluate on this session's own script thread while the audio renders
             evaluation = evaluate_answer(
                 user_answer, 
                 st.session_state.current_question, 
@@ -1387,9 +1676,9 @@ with tab_interview:
             st.session_state.current_evaluation = evaluation
             st.session_state.evaluations.append(evaluation)
             
-            # 3. Log to Database
+            # 3. Build the database record (written together with the next question below)
+            response_payload = None
             if st.session_state.session_id:
-                db = get_database()
                 response_payload = {
                     'question': st.session_state.current_question['question'],
                     'answer': user_answer,
@@ -1400,320 +1689,337 @@ with tab_interview:
                 # Add ideal answer if available (from custom questions)
                 if 'ideal_answer' in st.session_state.current_question:
                     response_payload['ideal_answer'] = st.session_state.current_question['ideal_answer']
-                
-                db.add_question_response(st.session_state.session_id, response_payload)
             
-            # 4. Get Next Question or Complete Session
-            st.session_state.flow_manager.current_session['last_answer'] = user_answer # Store for follow up
-            next_question = st.session_state.flow_manager.get_next_question()
+            # 4. Move to the Next Question or Complete Session
+            if response_payload:
+                # Response + User/AI transcript entries in a single save
+                db.add_turn(
+                    st.session_state.session_id,
+                    response_payload,
+                    next_question['question'] if next_question else None
+                )
             if next_question:
                 st.session_state.current_question = next_question
                 st.session_state.question_count += 1
                 st.session_state.transcript.append({'speaker':'AI','text': next_question['question']})
-                if st.session_state.session_id:
-                    try:
-                        get_database().append_transcript(st.session_state.session_id, 'AI', next_question['question'])
-                    except Exception:
-                        pass
                 st.session_state.question_start_time = time.time()
                 st.session_state.speak_next_question = True # Flag to speak the new question
             else:
                 st.session_state.session_complete = True
                 if st.session_state.session_id:
-                    db = get_database(); db.end_session(st.session_state.session_id)
+                    db.end_session(st.session_state.session_id)
                     
             # 5. Show Feedback UI
             st.session_state.show_feedback = True
             return
 
-        # Top bar
-        top_bar = st.container()
-        with top_bar:
-            bar_cols = st.columns([2,1,1,1.5,1,1])
-            with bar_cols[0]:
-                st.markdown(f"**Transcript**")
-            with bar_cols[1]:
-                # Camera toggle
-                show_camera = st.checkbox("📹 Camera", value=True, key="show_camera_toggle")
-                st.session_state.show_camera = show_camera
-            with bar_cols[2]:
-                # This button simulates starting a live mic recording
-                if st.button("🎙️ Record", disabled=st.session_state.processing):
-                    st.info("Recording simulated (use input below)")
-            with bar_cols[3]:
-                st.markdown(f"<div style='text-align:right;'>" 
-                            f"<span style='background:#FEF9C3;padding:4px 10px;border:1px solid #FACC15;border-radius:20px;font-size:.7rem;font-weight:600;'>Free Trial</span> "
-                            f"<span style='margin-left:6px;background:#6366F1;color:#fff;padding:4px 10px;border-radius:20px;font-size:.7rem;'>Q {st.session_state.question_count}</span></div>", unsafe_allow_html=True)
-            with bar_cols[4]:
-                st.markdown(f"<div style='font-size:.75rem;color:#475569;padding-top:.4rem;'>{st.session_state.company_name or 'Company'}</div>", unsafe_allow_html=True)
-            with bar_cols[5]:
-                if st.button("End Session", type="secondary"):
-                    st.session_state.session_complete = True
-                    if st.session_state.session_id:
-                        db = get_database()
-                        db.end_session(st.session_state.session_id)
-                    st.rerun()
+        @st.fragment
+        def _feedback_panel():
+            """Instant feedback for the last answer. Its toggle and Continue button rerun
+            only this panel."""
+            if not (st.session_state.show_feedback and st.session_state.current_evaluation):
+                return
+            st.markdown("---")
+            st.markdown("### 📋 Instant Feedback")
+
+            eval_data = st.session_state.current_evaluation
+
+            # Score display, as a single HTML grid
+            scores = [
+                ("Overall", eval_data['overall_score']),
+                ("Technical", eval_data['technical_accuracy']),
+                ("Communication", eval_data['communication_skills']),
+                ("Tone", eval_data['sentiment_tone']),
+                ("Completeness", eval_data['completeness'])
+            ]
+            cells = "".join(_METRIC_CELL.format(label=label, score=score) for label, score in scores)
+            st.markdown(f"{_METRIC_GRID_OPEN}{cells}</div>", unsafe_allow_html=True)
+
+            # Radar chart for skills: inline SVG by default, Plotly when enabled in Settings
+            radar_scores = (
+                eval_data['technical_accuracy'],
+                eval_data['communication_skills'],
+                eval_data['sentiment_tone'],
+                eval_data['completeness']
+            )
+            # A radar with four equal spokes carries no more than the metrics above it
+            if len(set(radar_scores)) == 1:
+                st.caption("Radar unavailable for uniform scores")
+            elif PLOTLY_AVAILABLE and st.session_state.get('use_plotly_radar', False):
+                st.plotly_chart(_build_radar(*radar_scores), use_container_width=True)
+            else:
+                st.markdown(f"<div style='text-align:center;'>{_radar_svg(radar_scores)}</div>", unsafe_allow_html=True)
+
+            # Detailed feedback
+            feedback = eval_data['feedback']
+
+            if feedback.get('strengths'):
+                with st.expander("✅ Strengths", expanded=True):
+                    for strength in feedback['strengths']:
+                        st.markdown(f"- {strength}")
+
+            if feedback.get('weaknesses'):
+                with st.expander("⚠️ Areas for Improvement"):
+                    for weakness in feedback['weaknesses']:
+                        st.markdown(f"- {weakness}")
+
+            if feedback.get('suggestions'):
+                with st.expander("💡 Suggestions"):
+                    for suggestion in feedback['suggestions']:
+                        st.markdown(f"- {suggestion}")
+
+            # Optional voice feedback
+            if st.toggle("🔊 Speak Feedback", value=False):
+                with st.spinner("AI generating voice feedback..."):
+                    try:
+                        # Synthesized once per evaluation; later reruns with the toggle on reuse the audio
+                        feedback_key = hashlib.md5(json.dumps(eval_data, sort_keys=True, default=str).encode()).hexdigest()
+                        audio_bytes = _feedback_audio(st.session_state.tts_engine_name, feedback_key, eval_data)
+                        if audio_bytes:
+                            st.audio(audio_bytes, format='audio/mp3', autoplay=True)
+                    except Exception:
+                        st.info("TTS engine not available for feedback speech.")
+
+            # Continue button; hides the panel without rerunning the dashboard around it
+            if st.button("➡️ Continue to Next Question", type="primary", use_container_width=True):
+                st.session_state.show_feedback = False
+                st.rerun(scope="fragment")
+
+        @st.fragment
+        def _render_active_interview():
+            """Active interview dashboard. Camera and typed-answer widgets rerun only this
+            fragment, feedback widgets only their own panel; answering, skipping or ending reruns the whole app so the
+            sidebar progress follows."""
+            # Top bar
+            top_bar = st.container()
+            with top_bar:
+                bar_cols = st.columns([2,1,1,1.5,1,1])
+                with bar_cols[0]:
+                    st.markdown(f"**Transcript**")
+                with bar_cols[1]:
+                    # Camera toggle; the widget key is the session value, no mirrored write
+                    st.toggle("📹 Camera", value=True, key="show_camera")
+                with bar_cols[2]:
+                    # This button simulates starting a live mic recording
+                    if st.button("🎙️ Record", disabled=st.session_state.processing):
+                        st.info("Recording simulated (use input below)")
+                with bar_cols[3]:
+                    st.markdown(f"<div style='text-align:right;'>" 
+                                f"<span style='background:#FEF9C3;padding:4px 10px;border:1px solid #FACC15;border-radius:20px;font-size:.7rem;font-weight:600;'>Free Trial</span> "
+                                f"<span style='margin-left:6px;background:#6366F1;color:#fff;padding:4px 10px;border-radius:20px;font-size:.7rem;'>Q {st.session_state.question_count}</span></div>", unsafe_allow_html=True)
+                with bar_cols[4]:
+                    st.markdown(f"<div style='font-size:.75rem;color:#475569;padding-top:.4rem;'>{st.session_state.company_name or 'Company'}</div>", unsafe_allow_html=True)
+                with bar_cols[5]:
+                    if st.button("End Session", type="secondary"):
+                        st.session_state.session_complete = True
+                        if st.session_state.session_id:
+                            db.end_session(st.session_state.session_id)
+                        st.rerun()
 
-        # ================= NEW VERTICAL LAYOUT (STATIC STYLE) =================
+            # ================= NEW VERTICAL LAYOUT (STATIC STYLE) =================
         
-        # Check if this is a connection to a meeting (Live or Async, we use Zoom-layout for all meetings)
-        is_live_meeting = False
-        if st.session_state.get('meeting_id'):
-            is_live_meeting = True
-
-        # 1. TOP: Video Interface
-        # We use a container to keep it strictly at the top
-        with st.container():
-            if is_live_meeting:
-                # Zoom-style Layout for Student: Main Interviewer, Small Self
-                # We use a 3:1 column split to create a "Stage + Sidebar" feel
-                col_live_main, col_live_side = st.columns([3, 1])
+            # Check if this is a connection to a meeting (Live or Async, we use Zoom-layout for all meetings)
+            is_live_meeting = False
+            if st.session_state.get('meeting_id'):
+                is_live_meeting = True
+
+            # 1. TOP: Video Interface
+            # We use a container to keep it strictly at the top
+            with st.container():
+                if is_live_meeting:
+                    # Zoom-style Layout for Student: Main Interviewer, Small Self
+                    # We use a 3:1 column split to create a "Stage + Sidebar" feel
+                    col_live_main, col_live_side = st.columns([3, 1])
                 
-                with col_live_main:
-                    st.markdown("**🎥 Interviewer**")
-                    # Main Stage - Interviewer Feed (Placeholder for simulation)
-                    st.markdown("""
-                    <div style="width:100%; height:400px; background-color:#f1f5f9; display:flex; flex-direction:column; align-items:center; justify-content:center; border-radius:8px; border: 2px dashed #cbd5e1; color:#64748b;">
-                        <div style="font-size:4rem; margin-bottom:1rem;">👨‍💼</div>
-                        <div style="font-weight:600; font-size:1.1rem; color:#475569;">Interviewer Video Feed</div>
-                        <div style="font-size:0.9rem; margin-top:0.5rem;">(Simulation Mode)</div>
-                        <div style="font-size:0.75rem; color:#94a3b8; max-width:80%; text-align:center; margin-top:1rem;">
-                            Real-time video streaming requires a dedicated signaling server.<br>
-                            This view confirms you are connected to the session.
+                    with col_live_main:
+                        st.markdown("**🎥 Interviewer**")
+                        # Main Stage - Interviewer Feed (Placeholder for simulation)
+                        st.markdown("""
+                        <div style="width:100%; height:400px; background-color:#f1f5f9; display:flex; flex-direction:column; align-items:center; justify-content:center; border-radius:8px; border: 2px dashed #cbd5e1; color:#64748b;">
+                            <div style="font-size:4rem; margin-bottom:1rem;">👨‍💼</div>
+                            <div style="font-weight:600; font-size:1.1rem; color:#475569;">Interviewer Video Feed</div>
+                            <div style="font-size:0.9rem; margin-top:0.5rem;">(Simulation Mode)</div>
+                            <div style="font-size:0.75rem; color:#94a3b8; max-width:80%; text-align:center; margin-top:1rem;">
+                                Real-time video streaming requires a dedicated signaling server.<br>
+                                This view confirms you are connected to the session.
+                            </div>
                         </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                        """, unsafe_allow_html=True)
                     
-                with col_live_side:
-                    st.markdown("**👤 You**")
-                    # Small Self View - Actual Camera
-                    st.camera_input("Your Camera", key="camera_feed_live_pip", label_visibility="collapsed")
+                    with col_live_side:
+                        st.markdown("**👤 You**")
+                        # Small Self View - Actual Camera
+                        st.camera_input("Your Camera", key="camera_feed_live_pip", label_visibility="collapsed")
                     
-            else:
-                # Standard Solo Layout (Practice Mode)
-                col_cam_pad1, col_cam, col_cam_pad2 = st.columns([1, 2, 1])
-                with col_cam:
-                    camera_image = st.camera_input("Live Camera Feed", key="camera_feed_persistent", label_visibility="hidden")
+                else:
+                    # Standard Solo Layout (Practice Mode)
+                    col_cam_pad1, col_cam, col_cam_pad2 = st.columns([1, 2, 1])
+                    with col_cam:
+                        camera_image = st.camera_input("Live Camera Feed", key="camera_feed_persistent", label_visibility="hidden")
                 
-        # 2. MIDDLE: Question Display
-        if st.session_state.current_question:
-            q = st.session_state.current_question
+            # 2. MIDDLE: Question Display
+            if st.session_state.current_question:
+                q = st.session_state.current_question
             
-            with st.container():
-                st.markdown("---")
-                question_label = f"Q{st.session_state.question_count}"
+                with st.container():
+                    st.markdown("---")
+                    question_label = f"Q{st.session_state.question_count}"
                 
-                # Badge logic
-                badge = ""
-                if q.get('custom_generated'):
-                    badge = " <span style='background:#10B981;color:white;padding:0.25rem 0.75rem;border-radius:12px;font-size:0.75rem;font-weight:600;margin-left:0.5rem;'>📋 TAILORED</span>"
-                elif q.get('is_follow_up'):
-                    badge = " <span style='background:#F59E0B;color:white;padding:0.25rem 0.75rem;border-radius:12px;font-size:0.75rem;font-weight:600;margin-left:0.5rem;'>↩️ FOLLOW-UP</span>"
+                    # Badge logic
+                    badge = ""
+                    if q.get('custom_generated'):
+                        badge = " <span style='background:#10B981;color:white;padding:0.25rem 0.75rem;border-radius:12px;font-size:0.75rem;font-weight:600;margin-left:0.5rem;'>📋 TAILORED</span>"
+                    elif q.get('is_follow_up'):
+                        badge = " <span style='background:#F59E0B;color:white;padding:0.25rem 0.75rem;border-radius:12px;font-size:0.75rem;font-weight:600;margin-left:0.5rem;'>↩️ FOLLOW-UP</span>"
                 
-                # Display Question clearly centered
-                st.markdown(
-                    f"<div style='text-align:center;padding:1.5rem 0;background:#FFFFFF;border-radius:12px;border:1px solid #E5E7EB;margin-bottom:1.5rem;box-shadow:0 4px 6px -1px rgba(0,0,0,0.1);'>"
-                    f"<div style='color:#6B7280;font-size:0.875rem;font-weight:600;margin-bottom:0.5rem;'>QUESTION {st.session_state.question_count}</div>"
-                    f"<div style='color:#111827;font-size:1.5rem;font-weight:700;line-height:1.4;padding:0 1.5rem;'>{q['question']}</div>"
-                    f"<div style='margin-top:0.5rem;'>{badge}</div>"
-                    f"</div>", 
-                    unsafe_allow_html=True
-                )
+                    # Display Question clearly centered
+                    st.markdown(
+                        f"<div style='text-align:center;padding:1.5rem 0;background:#FFFFFF;border-radius:12px;border:1px solid #E5E7EB;margin-bottom:1.5rem;box-shadow:0 4px 6px -1px rgba(0,0,0,0.1);'>"
+                        f"<div style='color:#6B7280;font-size:0.875rem;font-weight:600;margin-bottom:0.5rem;'>QUESTION {st.session_state.question_count}</div>"
+                        f"<div style='color:#111827;font-size:1.5rem;font-weight:700;line-height:1.4;padding:0 1.5rem;'>{q['question']}</div>"
+                        f"<div style='margin-top:0.5rem;'>{badge}</div>"
+                        f"</div>", 
+                        unsafe_allow_html=True
+                    )
 
-                # TTS Auto-play logic
-                if st.session_state.speak_next_question:
-                    with st.spinner("AI Speaking..."):
-                        try:
-                            audio_bytes = st.session_state.tts_engine.speak_text(q['question'])
-                            if audio_bytes:
-                                st.audio(audio_bytes, format='audio/mp3', autoplay=True)
-                        except Exception:
-                            pass
-                    st.session_state.speak_next_question = False
-
-        # 3. BOTTOM: Input Controls (Restricted to Mic Only as requested)
-        st.markdown("<div style='text-align:center;margin-bottom:0.5rem;font-weight:600;'>Record your answer:</div>", unsafe_allow_html=True)
+                    # TTS Auto-play logic
+                    if st.session_state.speak_next_question:
+                        with st.spinner("AI Speaking..."):
+                            try:
+                                prefetched = st.session_state.pop('next_tts', None)
+                                if prefetched and prefetched[0] == q['question']:
+                                    audio_bytes = prefetched[1].result()
+                                else:
+                                    audio_bytes = st.session_state.tts_engine.speak_text(q['question'])
+                                if audio_bytes:
+                                    st.audio(audio_bytes, format='audio/mp3', autoplay=True)
+                            except Exception:
+                                pass
+                        st.session_state.speak_next_question = False
+
+            # 3. BOTTOM: Input Controls (Restricted to Mic Only as requested)
+            st.markdown("<div style='text-align:center;margin-bottom:0.5rem;font-weight:600;'>Record your answer:</div>", unsafe_allow_html=True)
         
-        # Center the audio input
-        input_col1, input_col2, input_col3 = st.columns([1, 1, 1])
-        with input_col2:
-            # Audio input - Disabled upload by not including file_uploader
-            audio_input = st.audio_input("Record Answer", key=f"audio_{st.session_state.question_count}", disabled=st.session_state.processing or st.session_state.paused, label_visibility="collapsed")
+            # Center the audio input
+            input_col1, input_col2, input_col3 = st.columns([1, 1, 1])
+            with input_col2:
+                # Audio input - Disabled upload by not including file_uploader
+                audio_input = st.audio_input("Record Answer", key=f"audio_{st.session_state.question_count}", disabled=st.session_state.processing or st.session_state.paused, label_visibility="collapsed")
             
-            # Optional: Keep typed answer for accessibility, but hidden in expander
-            with st.expander("⌨️  Type answer instead"):
-                typed_answer = st.text_area("Written Response", key=f"typed_answer_{st.session_state.question_count}")
-                submit_typed = st.button("Submit Text", use_container_width=True)
-
-        with input_col3:
-            # Next button (Right aligned visually)
-            st.markdown("<br>", unsafe_allow_html=True)
-            if st.button("Skip / Next ➜", help="Skip this question without answering if stuck."):
-                 # Mark as skipped in database
-                 if st.session_state.session_id:
-                     db = get_database()
-                     # Dummy empty answer
-                     db.add_question_response(st.session_state.session_id, {
-                        'question': st.session_state.current_question['question'],
-                        'answer': "[SKIPPED]",
-                        'evaluation': {'overall_score': 0, 'feedback': {'strengths': [], 'weaknesses': ['Question skipped'], 'suggestions': []}},
-                        'stt_metrics': {}
-                    })
-                 
-                 # Move flow
-                 next_q = st.session_state.flow_manager.get_next_question()
-                 if next_q:
-                     st.session_state.current_question = next_q
-                     st.session_state.question_count += 1
-                     st.session_state.speak_next_question = True
-                 else:
-                     st.session_state.session_complete = True
-                     if st.session_state.session_id:
-                        get_database().end_session(st.session_state.session_id)
-                 st.rerun()
-
-        # Logic to process answer
-        if not st.session_state.processing and not st.session_state.paused:
-            # 1. Process Audio
-            if audio_input is not None:
-                st.session_state.processing = True
-                with st.spinner("🔄 AI Analyzing your response..."):
-                    try:
-                        stt_result = transcribe_audio(audio_input, engine=st.session_state.stt_engine_name)
-                        if stt_result['success']:
-                            st.session_state.stt_metrics = stt_result
-                            _process_answer(stt_result['text'], stt_result)
-                        else:
-                            st.error(f"❌ {stt_result.get('error', 'Could not process audio')}")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
-                    finally:
-                        st.session_state.processing = False
-                        st.rerun()
-
-            # 2. Process Typed
-            elif submit_typed and typed_answer.strip():
-                st.session_state.processing = True
-                _process_answer(typed_answer.strip(), stt_result_meta={})
-                st.session_state.processing = False
-                st.rerun()
-
-        # Show feedback if available
-        if st.session_state.show_feedback and st.session_state.current_evaluation:
-                st.markdown("---")
-                st.markdown("### 📋 Instant Feedback")
-
-                eval_data = st.session_state.current_evaluation
-
-                # Score display
-                score_cols = st.columns(5)
-                scores = [
-                    ("Overall", eval_data['overall_score']),
-                    ("Technical", eval_data['technical_accuracy']),
-                    ("Communication", eval_data['communication_skills']),
-                    ("Tone", eval_data['sentiment_tone']),
-                    ("Completeness", eval_data['completeness'])
-                ]
-
-                for col, (label, score) in zip(score_cols, scores):
-                    with col:
-                        st.metric(label, f"{score:.0f}")
-
-                # Radar chart for skills
-                categories = ["Technical", "Communication", "Tone", "Completeness"]
-                values = [
-                    eval_data['technical_accuracy'],
-                    eval_data['communication_skills'],
-                    eval_data['sentiment_tone'],
-                    eval_data['completeness']
-                ]
-                if PLOTLY_AVAILABLE:
-                    # Note: Need to import plotly.graph_objects as go
-                    fig = go.Figure(data=go.Scatterpolar(r=values + [values[0]], theta=categories + [categories[0]], fill='toself', name='Skills'))
-                    fig.update_layout(polar=dict(radialaxis=dict(visible=True, range=[0,100])), showlegend=False, height=350)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.info("Install plotly to see radar charts: pip install plotly")
+                # Optional: Keep typed answer for accessibility, but hidden in expander
+                with st.expander("⌨️  Type answer instead"):
+                    typed_answer = st.text_area("Written Response", key=f"typed_answer_{st.session_state.question_count}")
+                    submit_typed = st.button("Submit Text", use_container_width=True)
 
-                # Detailed feedback
-                feedback = eval_data['feedback']
-
-                if feedback.get('strengths'):
-                    with st.expander("✅ Strengths", expanded=True):
-                        for strength in feedback['strengths']:
-                            st.markdown(f"- {strength}")
+            with input_col3:
+                # Next button (Right aligned visually)
+                st.markdown("<br>", unsafe_allow_html=True)
+                if st.button("Skip / Next ➜", help="Skip this question without answering if stuck."):
+                     # Mark as skipped in database
+                     if st.session_state.session_id:
+                         # Dummy empty answer
+                         db.add_question_response(st.session_state.session_id, {
+                            'question': st.session_state.current_question['question'],
+                            'answer': "[SKIPPED]",
+                            'evaluation': {'overall_score': 0, 'feedback': {'strengths': [], 'weaknesses': ['Question skipped'], 'suggestions': []}},
+                            'stt_metrics': {}
+                        })
+                 
+                     # Move flow
+                     next_q = st.session_state.flow_manager.get_next_question()
+                     if next_q:
+                         st.session_state.current_question = next_q
+                         st.session_state.question_count += 1
+                         st.session_state.speak_next_question = True
+                     else:
+                         st.session_state.session_complete = True
+                         if st.session_state.session_id:
+                            db.end_session(st.session_state.session_id)
+                     st.rerun()
+
+            # Logic to process answer
+            if not st.session_state.processing and not st.session_state.paused:
+                # 1. Process Audio
+                if audio_input is not None:
+                    st.session_state.processing = True
+                    with st.spinner("🔄 AI Analyzing your response..."):
+                        try:
+                            stt_result = transcribe_audio(audio_input, engine=st.session_state.stt_engine_name)
+                            if stt_result['success']:
+                                st.session_state.stt_metrics = stt_result
+                                _process_answer(stt_result['text'], stt_result)
+                            else:
+                                st.error(f"❌ {stt_result.get('error', 'Could not process audio')}")
+                        except Exception as e:
+                            st.error(f"❌ Error: {str(e)}")
+                        finally:
+                            st.session_state.processing = False
+                            st.rerun()
 
-                if feedback.get('weaknesses'):
-                    with st.expander("⚠️ Areas for Improvement"):
-                        for weakness in feedback['weaknesses']:
-                            st.markdown(f"- {weakness}")
+                # 2. Process Typed
+                elif submit_typed and typed_answer.strip():
+                    st.session_state.processing = True
+                    _process_answer(typed_answer.strip(), stt_result_meta={})
+                    st.session_state.processing = False
+                    st.rerun()
 
-                if feedback.get('suggestions'):
-                    with st.expander("💡 Suggestions"):
-                        for suggestion in feedback['suggestions']:
-                            st.markdown(f"- {suggestion}")
+            # Show feedback if available
+            _feedback_panel()
 
-                # Optional voice feedback
-                if st.toggle("🔊 Speak Feedback", value=False):
-                    with st.spinner("AI generating voice feedback..."):
-                        try:
-                            # Assuming generate_feedback_speech compiles feedback into a single string
-                            speech_text = st.session_state.tts_engine.generate_feedback_speech(eval_data)
-                            audio_bytes = st.session_state.tts_engine.speak_text(speech_text)
-                            if audio_bytes:
-                                st.audio(audio_bytes, format='audio/mp3', autoplay=True)
-                        except Exception:
-                            st.info("TTS engine not available for feedback speech.")
-
-                # Continue button
-                if st.button("➡️ Continue to Next Question", type="primary", use_container_width=True):
-                    st.session_state.show_feedback = False
-                    st.rerun()
+        _render_active_interview()
 
 # =============================
 # HISTORY TAB
 # =============================
 with tab_history:
     st.markdown("### 📚 Past Sessions")
-    db = get_database()
-    sessions = db.get_recent_sessions(limit=20)
-    if not sessions:
+    db = _db()
+    session_labels = _history_options(db.version)
+    if not session_labels:
         st.info("No sessions found yet. Complete an interview to see history here.")
     else:
-        # Create a display name that includes the user's name if available, falling back to anonymous
-        options = [f"{s['session_id']} | {s.get('user_name', 'Anonymous')} | {s['mode']} | {s['difficulty']} | {s['start_time'][:19]}" for s in sessions]
-        selected = st.selectbox("Select a session", options)
-        if selected:
-            sid = selected.split(" | ")[0]
-            session = db.get_session(sid)
-            analytics = db.get_analytics(sid)
+        sid = st.selectbox("Select a session", list(session_labels), format_func=session_labels.get)
+        if sid:
+            session, analytics = _session_and_analytics(sid, db.version)
 
             st.markdown(f"**User:** {session.get('user_name', 'Anonymous')} | **Mode:** {session['mode']} | **Difficulty:** {session['difficulty']}")
             st.markdown(f"**Overall Score:** {session['overall_score']:.1f}")
 
-            # Skill bars
+            # Skill bars, as a single table element; fixed order for display consistency
             skills = analytics.get('skill_breakdown', {})
-            bar_cols = st.columns(4)
-            # Use fixed order for display consistency
-            skill_order = ['technical_accuracy', 'communication_skills', 'sentiment_tone', 'completeness']
-            
-            for k in skill_order:
-                if k in skills:
-                    v = skills[k]
-                    with bar_cols.pop(0) if bar_cols else st.container(): # Use pop(0) to sequence columns
-                        st.metric(k.replace('_',' ').title(), f"{v:.1f}")
-                        st.progress(v/100)
+            skill_rows = [
+                {'Skill': k.replace('_',' ').title(), 'Score': skills[k]}
+                for _, k in _SKILL_FIELDS if k in skills
+            ]
+            if skill_rows:
+                st.dataframe(
+                    skill_rows,
+                    column_config={'Score': st.column_config.ProgressColumn(format="%.1f", min_value=0, max_value=100)},
+                    hide_index=True,
+                    use_container_width=True
+                )
 
             # Question list
             with st.expander("📝 Question Details", expanded=False):
-                for idx, q in enumerate(session['questions'], 1):
-                    st.markdown(f"**Q{idx}.** {q['question']}")
-                    st.markdown(f"↪️ *Answer:* {q['answer']}")
-                    # Safely access evaluation data
-                    score = q['evaluation'].get('overall_score', 'N/A')
-                    grade = q['evaluation'].get('grade', 'N/A')
-                    st.caption(f"Score: {score}/100 | Grade: {grade}")
-                    st.markdown("---")
+                # One table per page of questions, built column by column; evaluation fields are read safely
+                questions = session['questions']
+                pages = max(1, math.ceil(len(questions) / HISTORY_PAGE_SIZE))
+                page = st.number_input("Page", 1, pages, 1, key=f"q_page_{sid}") if pages > 1 else 1
+                start = (page - 1) * HISTORY_PAGE_SIZE
+                questions = questions[start:start + HISTORY_PAGE_SIZE]
+                evals = [q['evaluation'] for q in questions]
+                st.dataframe(
+                    {
+                        '#': range(start + 1, start + len(questions) + 1),
+                        'Question': [q['question'] for q in questions],
+                        'Answer': [q['answer'] for q in questions],
+                        'Score': [e.get('overall_score') for e in evals],
+                        'Grade': [e.get('grade', 'N/A') for e in evals],
+                    },
+                    column_config={'Score': st.column_config.NumberColumn(format="%.0f / 100")},
+                    hide_index=True,
+                    use_container_width=True
+                )
 
             # Download buttons
             c1, c2, c3 = st.columns(3)
@@ -1723,19 +2029,23 @@ with tab_history:
                     with st.spinner("Preparing PDF..."):
                         path = generate_report(session, analytics, format="pdf")
                         if os.path.exists(path):
-                            with open(path, 'rb') as f:
-                                st.download_button("Download PDF", f.read(), file_name=f"{sid}.pdf", mime="application/pdf", key=f"pdf_dl_{sid}")
+                            st.download_button("Download PDF", _read_report_bytes(path, os.path.getmtime(path)), file_name=f"{sid}.pdf", mime="application/pdf", key=f"pdf_dl_{sid}")
                         else:
                             st.warning("PDF file not found. Check report generation library (fpdf/fpdf2).")
 
+            # Listed sessions can still be in progress or get reviewed, so cached reports
+            # are keyed on what the report shows, not just the session id
+            report_rev = (session.get('status'), len(session['questions']))
             with c2:
                 # Text report download
-                txt_path = generate_report(session, analytics, format="txt")
-                with open(txt_path, 'r', encoding='utf-8') as f:
-                    st.download_button("📄 Text Report", f.read(), file_name=f"{sid}.txt", key=f"txt_dl_{sid}")
+                txt_path = _report_file(sid, "txt", session, analytics, revision=report_rev)
+                if os.path.exists(txt_path):
+                    st.download_button("📄 Text Report", _read_report_bytes(txt_path, os.path.getmtime(txt_path)), file_name=f"{sid}.txt", key=f"txt_dl_{sid}")
+                else:
+                    st.warning("Text report file could not be generated.")
             with c3:
                 # JSON data download
-                json_data = generate_report(session, analytics, format="json")
+                json_data = _json_report(sid, session, analytics, revision=report_rev)
                 st.download_button("📄 JSON Data", json_data, file_name=f"{sid}.json", mime="application/json", key=f"json_dl_{sid}")
 
 # =============================
@@ -1787,7 +2097,7 @@ with tab_settings:
             )
             if tts_choice != st.session_state.tts_engine_name:
                 st.session_state.tts_engine_name = tts_choice
-                st.session_state.tts_engine = TTSEngine(engine=tts_choice)
+                st.session_state.tts_engine = _tts(tts_choice)
             
             # TTS Advanced Settings
             with st.expander("Voice Settings"):
@@ -1818,6 +2128,7 @@ with tab_settings:
             st.toggle("Dark Mode", value=False, key='dark_mode', help="Switch between light and dark theme")
             st.toggle("Show Video Preview", value=True, key='show_video', help="Display webcam feed during interviews")
             st.toggle("Enable Animations", value=True, key='enable_animations', help="Enable UI animations and transitions")
+            st.toggle("Interactive Radar Charts", value=False, key='use_plotly_radar', disabled=not PLOTLY_AVAILABLE, help="Draw feedback radar charts with Plotly instead of a lightweight SVG")
         
         with col2:
             st.markdown("**Layout**")
@@ -1842,12 +2153,14 @@ with tab_settings:
         gemini_key = st.text_input("Google Gemini API Key", value=st.session_state.get('gemini_api_key', ''), type="password", help="Get a free key from Google AI Studio")
         if gemini_key:
             st.session_state.gemini_api_key = gemini_key
-            # Save to user profile if logged in
-            if st.session_state.get('logged_in') and st.session_state.get('current_user'):
-                db = get_database()
-                username = st.session_state.current_user.get('username')
-                if username:
-                    db.update_user_api_key(username, gemini_key)
+            # Save to user profile if logged in, only when the key actually changed
+            user = st.session_state.get('current_user')
+            if st.session_state.get('logged_in') and user:
+                username = user.get('username')
+                if username and user.get('api_key') != gemini_key:
+                    _db().update_user_api_key(username, gemini_key)
+                    user['api_key'] = gemini_key
+                    _auth.clear()  # Cached sign-ins carry the old key
             st.success("✅ Advanced LLM Evaluation Enabled (Saved to Profile)")
         else:
             st.warning("⚠️ Using local lightweight models. Output quality may be limited.")
@@ -1870,34 +2183,37 @@ with tab_settings:
         
         # Question Bank Preview
         st.markdown("#### Question Bank")
-        if st.session_state.flow_manager is None:
-            st.session_state.flow_manager = InterviewFlowManager()
-            
-        preview_col1, preview_col2 = st.columns(2)
-        with preview_col1:
-            preview_mode = st.selectbox(
-                "Interview Mode", 
-                ["HR", "Technical", "Mixed"], 
-                key='preview_mode',
-                help="Filter questions by interview type"
-            )
-        with preview_col2:
-            preview_level = st.selectbox(
-                "Difficulty Level", 
-                ["Beginner", "Intermediate", "Advanced", "Expert"], 
-                key='preview_level',
-                help="Filter questions by difficulty"
-            )
-            
-        # Get and display questions
-        qs = st.session_state.flow_manager.get_all_questions(preview_mode, preview_level)
-        if qs:
-            st.info(f"Showing {len(qs)} questions for {preview_mode} mode ({preview_level} level)")
-            with st.expander("View Questions"):
-                for i, q in enumerate(qs, 1):
-                    st.markdown(f"**{i}.** {q['question']}")
-        else:
-            st.warning("No questions found for the selected criteria.")
+        
+        # Runs as a fragment so changing the preview filters reruns only this block
+        @st.fragment
+        def _question_preview():
+            preview_col1, preview_col2 = st.columns(2)
+            with preview_col1:
+                preview_mode = st.selectbox(
+                    "Interview Mode", 
+                    ["HR", "Technical", "Mixed"], 
+                    key='preview_mode',
+                    help="Filter questions by interview type"
+                )
+            with preview_col2:
+                preview_level = st.selectbox(
+                    "Difficulty Level", 
+                    ["Beginner", "Intermediate", "Advanced", "Expert"], 
+                    key='preview_level',
+                    help="Filter questions by difficulty"
+                )
+                
+            # Get and display questions
+            qs = _preview_questions(preview_mode, preview_level)
+            if qs:
+                st.info(f"Showing {len(qs)} questions for {preview_mode} mode ({preview_level} level)")
+                with st.expander("View Questions"):
+                    for i, q in enumerate(qs, 1):
+                        st.markdown(f"**{i}.** {q}")
+            else:
+                st.warning("No questions found for the selected criteria.")
+        
+        _question_preview()
     
     with settings_tabs[3]:  # Account Settings
         st.markdown("#### Account Management")
@@ -3,28 +3,37 @@ Modules Package
 AI-Powered Virtual Interview Practice Application
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "AI Assistant"
 
-from .stt_engine import transcribe_audio, STTEngine
-from .nlp_evaluator import evaluate_answer, NLPEvaluator
-from .tts_engine import text_to_speech, TTSEngine, generate_feedback_speech
-from .database import get_database, InterviewDatabase
-from .report_generator import generate_report, InterviewReportGenerator
-from .interview_flow import create_flow_manager, InterviewFlowManager
+# Public name -> submodule. Submodules are imported on first attribute access
+# so that e.g. `from modules.database import get_database` does not pull in
+# the speech, NLP and PDF stacks as a side effect.
+_EXPORTS = {
+    'STTEngine': 'stt_engine',
+    'transcribe_audio': 'stt_engine',
+    'NLPEvaluator': 'nlp_evaluator',
+    'evaluate_answer': 'nlp_evaluator',
+    'TTSEngine': 'tts_engine',
+    'text_to_speech': 'tts_engine',
+    'generate_feedback_speech': 'tts_engine',
+    'InterviewDatabase': 'database',
+    'get_database': 'database',
+    'InterviewReportGenerator': 'report_generator',
+    'generate_report': 'report_generator',
+    'InterviewFlowManager': 'interview_flow',
+    'create_flow_manager': 'interview_flow'
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    'STTEngine',
-    'transcribe_audio',
-    'NLPEvaluator',
-    'evaluate_answer',
-    'TTSEngine',
-    'text_to_speech',
-    'generate_feedback_speech',
-    'InterviewDatabase',
-    'get_database',
-    'InterviewReportGenerator',
-    'generate_report',
-    'InterviewFlowManager',
-    'create_flow_manager'
-]
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ import json
 import os
 import hashlib
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -57,6 +57,7 @@ class InterviewDatabase:
         self.sessions = []
         self.users = {}
         self.meetings = {}
+        self.version = 0  # Bumped on every session write; lets callers cache derived views
         
         if not self.use_mongo:
             # Create directory if it doesn't exist
@@ -328,6 +329,7 @@ class InterviewDatabase:
     
     def _save_database(self):
         """Save database to file"""
+        self.version += 1
         if self.use_mongo:
             return True
 
@@ -372,9 +374,13 @@ class InterviewDatabase:
         Returns:
             Session ID
         """
+        return self._insert_session(self._new_session(mode, difficulty, user_name, metadata, meeting_id))
+
+    def _new_session(self, mode: str, difficulty: str, user_name: str, metadata: Optional[Dict], meeting_id: str) -> Dict:
+        """Build a new, unsaved session record"""
         session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(hash(datetime.now()))[-6:]}"
         
-        session = {
+        return {
             'session_id': session_id,
             'user_name': user_name,
             'mode': mode,
@@ -388,15 +394,41 @@ class InterviewDatabase:
             'meeting_id': meeting_id,
             'transcript': []
         }
+
+    def create_session_with_initial_transcript(self, mode: str, difficulty: str, user_name: str = "Anonymous",
+                                               metadata: Optional[Dict] = None, meeting_id: str = None,
+                                               initial_speaker: str = "AI", initial_text: str = "") -> str:
+        """
+        Create a new interview session already holding its opening transcript
+        entry, with a single insert/save
         
+        Args:
+            mode: Interview mode (HR/Technical/Mixed)
+            difficulty: Difficulty level
+            user_name: User's name
+            metadata: Additional metadata
+            meeting_id: Meeting ID if applicable
+            initial_speaker: Speaker of the opening entry
+            initial_text: Text of the opening entry (usually the first question)
+            
+        Returns:
+            Session ID
+        """
+        session = self._new_session(mode, difficulty, user_name, metadata, meeting_id)
+        self._append_transcript_entries(session, [(initial_speaker, initial_text)])
+        return self._insert_session(session)
+
+    def _insert_session(self, session: Dict) -> str:
+        """Persist a freshly built session and return its id"""
         if self.use_mongo:
              self.db.sessions.insert_one(session)
-             return session_id
+             self.version += 1  # Mongo writes skip _save_database, which bumps it otherwise
+             return session['session_id']
 
         self.sessions.append(session)
         self._save_database()
         
-        return session_id
+        return session['session_id']
     
     def add_question_response(self, session_id: str, question_data: Dict):
         """
@@ -408,18 +440,56 @@ class InterviewDatabase:
         """
         session = self._get_session(session_id)
         if session:
-            session['questions'].append({
-                'timestamp': datetime.now().isoformat(),
-                'question': question_data['question'],
-                'answer': question_data['answer'],
-                'evaluation': question_data['evaluation'],
-                'stt_metrics': question_data.get('stt_metrics', {}),
-                'duration': question_data.get('duration', 0)
-            })
+            self._append_question(session, question_data)
             self._save_database()
         else:
             logger.warning(f"Session {session_id} not found")
 
+    def add_turn(self, session_id: str, question_data: Dict, next_question: Optional[str] = None):
+        """
+        Record one answered question with a single save: the response, the
+        candidate's transcript entry and, if any, the AI's next question
+        
+        Args:
+            session_id: Session identifier
+            question_data: Dictionary containing question, answer, and evaluation
+            next_question: Text of the follow-up question asked next, if any
+        """
+        session = self._get_session(session_id)
+        if not session:
+            logger.warning(f"Session {session_id} not found")
+            return False
+        self._append_question(session, question_data)
+        entries = [('User', question_data['answer'])]
+        if next_question:
+            entries.append(('AI', next_question))
+        self._append_transcript_entries(session, entries)
+        self._save_database()
+        return True
+
+    def _append_question(self, session: Dict, question_data: Dict):
+        """Append a question response to a session without saving"""
+        session['questions'].append({
+            'timestamp': datetime.now().isoformat(),
+            'question': question_data['question'],
+            'answer': question_data['answer'],
+            'evaluation': question_data['evaluation'],
+            'stt_metrics': question_data.get('stt_metrics', {}),
+            'duration': question_data.get('duration', 0)
+        })
+
+    def _append_transcript_entries(self, session: Dict, entries: List[Tuple[str, str]]):
+        """Append (speaker, text) transcript entries to session metadata without saving"""
+        meta = session.get('metadata', {})
+        transcript = meta.get('transcript', [])
+        timestamp = datetime.now().isoformat()
+        transcript.extend(
+            {'timestamp': timestamp, 'speaker': speaker, 'text': text}
+            for speaker, text in entries
+        )
+        meta['transcript'] = transcript
+        session['metadata'] = meta
+
     def update_session_meta(self, session_id: str, new_meta: Dict):
         """Merge new metadata into existing session metadata"""
         session = self._get_session(session_id)
@@ -438,15 +508,7 @@ class InterviewDatabase:
         if not session:
             logger.warning(f"Session {session_id} not found for transcript append")
             return False
-        meta = session.get('metadata', {})
-        transcript = meta.get('transcript', [])
-        transcript.append({
-            'timestamp': datetime.now().isoformat(),
-            'speaker': speaker,
-            'text': text
-        })
-        meta['transcript'] = transcript
-        session['metadata'] = meta
+        self._append_transcript_entries(session, [(speaker, text)])
         self._save_database()
         return True
     
@@ -511,6 +573,7 @@ class InterviewDatabase:
                 if selection_result: update_fields["human_selection"] = selection_result
                 if email_sent: update_fields["email_sent"] = True
                 self.db.sessions.update_one({"session_id": session_id}, {"$set": update_fields})
+                self.version += 1  # Mongo writes skip _save_database, which bumps it otherwise
             else:
                 self._save_database()
             return True
@@ -0,0 +1,64 @@
+"""
+Gemini Client Module
+Per-API-key access to Google Gemini shared by question generation and answer evaluation
+"""
+
+import functools
+import importlib
+import importlib.util
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Optional: Google Gemini. The SDK is slow to import, so only check it's
+# installed here and import it on first use.
+try:
+    GEMINI_AVAILABLE = importlib.util.find_spec('google.generativeai') is not None
+except ModuleNotFoundError:  # 'google' namespace package itself missing
+    GEMINI_AVAILABLE = False
+
+DEFAULT_MODEL = "models/gemini-pro"
+
+
+def _glm():
+    """The generativelanguage API module shipped with the Gemini SDK, imported on first use"""
+    return importlib.import_module('google.ai.generativelanguage')
+
+
+@functools.lru_cache(maxsize=32)
+def _client(api_key: str):
+    """Service client carrying its own API key; no process-wide genai.configure()"""
+    return _glm().GenerativeServiceClient(client_options={"api_key": api_key})
+
+
+class GeminiModel:
+    """A Gemini model bound to one API key, safe to use alongside other users' keys"""
+
+    def __init__(self, api_key: str, model_name: str = DEFAULT_MODEL):
+        """
+        Initialize the model
+
+        Args:
+            api_key: Google Gemini API key used for every request from this model
+            model_name: Gemini model resource name
+        """
+        self.model_name = model_name
+        self._client = _client(api_key)
+
+    def generate_text(self, prompt: str) -> str:
+        """
+        Run a prompt and return the generated text
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Text of the first candidate
+        """
+        glm = _glm()
+        response = self._client.generate_content(
+            model=self.model_name,
+            contents=[glm.Content(parts=[glm.Part(text=prompt)])]
+        )
+        return "".join(part.text for part in response.candidates[0].content.parts)
@@ -5,18 +5,17 @@ Manages question selection, follow-up generation, and interview progression
 
 import json
 import random
+import itertools
 from typing import Dict, List, Optional
 import logging
 
+from .gemini_client import GEMINI_AVAILABLE, GeminiModel
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Optional: Google Gemini
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+# Process-unique ids for flow managers; unlike id(), never reused after one is freed
+_MANAGER_IDS = itertools.count(1)
 
 
 class InterviewFlowManager:
@@ -32,6 +31,8 @@ class InterviewFlowManager:
         self.questions_path = questions_path
         self.questions_bank = {}
         self.current_session = None
+        self.uid = next(_MANAGER_IDS)
+        self.version = 0  # Bumped whenever get_progress() output changes
         self.api_key = None
         self.llm_model = None
         self.load_questions()
@@ -40,8 +41,7 @@ class InterviewFlowManager:
         """Configure LLM for dynamic generation"""
         if api_key and GEMINI_AVAILABLE:
             try:
-                genai.configure(api_key=api_key)
-                self.llm_model = genai.GenerativeModel('gemini-pro')
+                self.llm_model = GeminiModel(api_key)
                 self.api_key = api_key
                 logger.info("Questions LLM Configured")
             except Exception as e:
@@ -138,6 +138,7 @@ class InterviewFlowManager:
             'follow_up_needed': False,
             'last_answer': None # Track for follow-ups
         }
+        self.version += 1
         
         return self.current_session
     
@@ -185,6 +186,7 @@ class InterviewFlowManager:
         
         self.current_session['questions_asked'].append(question)
         self.current_session['current_index'] += 1
+        self.version += 1
         
         return question
     
@@ -231,8 +233,7 @@ class InterviewFlowManager:
         Do not use markdown formatting.
         """
         
-        response = self.llm_model.generate_content(prompt)
-        text = response.text.strip().replace('```json', '').replace('```', '')
+        text = self.llm_model.generate_text(prompt).strip().replace('```json', '').replace('```', '')
         questions = json.loads(text)
         
         # Tag them
@@ -259,8 +260,7 @@ class InterviewFlowManager:
                 Generate a short, single sentence follow-up question to dig deeper, clarify, or challenge the candidate.
                 Return ONLY the question text.
                 """
-                response = self.llm_model.generate_content(prompt)
-                follow_up_text = response.text.strip()
+                follow_up_text = self.llm_model.generate_text(prompt).strip()
                 
                 return {
                     'question': follow_up_text,
@@ -450,6 +450,7 @@ class InterviewFlowManager:
     def end_session(self):
         """End the current session"""
         self.current_session = None
+        self.version += 1
     
     def _get_default_questions(self) -> Dict:
         """Provide default questions if file loading fails"""
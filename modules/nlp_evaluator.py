@@ -27,12 +27,8 @@ except ImportError:
     TEXTBLOB_AVAILABLE = False
     logger.warning("TextBlob not available. Using basic sentiment analysis.")
 
-# Optional: Google Gemini
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+# Optional: Google Gemini (SDK imported on first use)
+from .gemini_client import GEMINI_AVAILABLE, GeminiModel
 
 
 class NLPEvaluator:
@@ -49,8 +45,7 @@ class NLPEvaluator:
         
         if self.use_llm:
             try:
-                genai.configure(api_key=self.api_key)
-                self.llm_model = genai.GenerativeModel('gemini-pro')
+                self.llm_model = GeminiModel(self.api_key)
                 logger.info("Configured Google Gemini LLM")
             except Exception as e:
                 logger.error(f"Failed to configure Gemini: {e}")
@@ -171,8 +166,8 @@ class NLPEvaluator:
         """
         
         try:
-            response = self.llm_model.generate_content(prompt)
-            data = json.loads(response.text.strip().replace('```json', '').replace('```', ''))
+            text = self.llm_model.generate_text(prompt)
+            data = json.loads(text.strip().replace('```json', '').replace('```', ''))
             
             # Ensure proper structure
             data['grade'] = self._get_grade(data['overall_score'])
@@ -8,6 +8,7 @@ from typing import Optional
 import io
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -44,25 +45,38 @@ class TTSEngine:
         self.voice = voice
         self.rate = rate
         self.engine = None
+        # pyttsx3 drivers are bound to the thread that created the engine, so the
+        # engine is created and always driven on one dedicated thread. Callers on
+        # any thread hand work to it, which also keeps renders from overlapping.
+        self._pyttsx3_thread = None
         
         if engine == "pyttsx3" and PYTTSX3_AVAILABLE:
-            try:
-                self.engine = pyttsx3.init()
-                self.engine.setProperty('rate', rate)
-                
-                # Try to set a pleasant voice
-                voices = self.engine.getProperty('voices')
-                if voices:
-                    # Prefer female voice (often clearer)
-                    for v in voices:
-                        if 'female' in v.name.lower() or 'zira' in v.name.lower():
-                            self.engine.setProperty('voice', v.id)
-                            break
-                
-                logger.info("pyttsx3 engine initialized")
-            except Exception as e:
-                logger.error(f"Failed to initialize pyttsx3: {e}")
-                self.engine = None
+            self._pyttsx3_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyttsx3")
+            self.engine = self._pyttsx3_thread.submit(self._init_pyttsx3, rate).result()
+            if self.engine is None:
+                self._pyttsx3_thread.shutdown(wait=False)
+                self._pyttsx3_thread = None
+    
+    def _init_pyttsx3(self, rate: int):
+        """Create the pyttsx3 engine; runs on the engine's own thread"""
+        try:
+            engine = pyttsx3.init()
+            engine.setProperty('rate', rate)
+            
+            # Try to set a pleasant voice
+            voices = engine.getProperty('voices')
+            if voices:
+                # Prefer female voice (often clearer)
+                for v in voices:
+                    if 'female' in v.name.lower() or 'zira' in v.name.lower():
+                        engine.setProperty('voice', v.id)
+                        break
+            
+            logger.info("pyttsx3 engine initialized")
+            return engine
+        except Exception as e:
+            logger.error(f"Failed to initialize pyttsx3: {e}")
+            return None
     
     def speak_text(self, text: str, save_path: Optional[str] = None) -> Optional[bytes]:
         """
@@ -108,6 +122,10 @@ class TTSEngine:
         if not self.engine:
             return None
         
+        return self._pyttsx3_thread.submit(self._render_pyttsx3, text, save_path).result()
+    
+    def _render_pyttsx3(self, text: str, save_path: Optional[str] = None) -> Optional[bytes]:
+        """Render speech to a file with pyttsx3; runs on the engine's own thread"""
         if save_path:
             self.engine.save_to_file(text, save_path)
             self.engine.runAndWait()